@@ -0,0 +1,47 @@
+import os
+import time
+
+from utils.algorithms import BaseAlgorithmThreaded, WandererThreaded, WallHuggerThreaded
+from utils.maze_generator import Maze, MazeGenerator
+
+
+def measure(algorithm_class: type[BaseAlgorithmThreaded], maze: Maze, free_running: bool, num_threads: int,
+            max_steps: int) -> tuple[float, int, bool]:
+    """ Measure the time of solving a maze, returning it with the thread steps taken and whether it was solved. """
+
+    algorithm = algorithm_class()
+    algorithm.setup(maze, num_threads = num_threads)
+
+    solve_time = time.perf_counter()
+    if free_running:
+        _, _, reached_end = algorithm.run_free(max_steps)
+    else:
+        # Every lockstep step moves each active thread once
+        _, _, reached_end = algorithm.run(max_steps // algorithm.num_threads)
+    solve_time = time.perf_counter() - solve_time
+    steps_taken = algorithm.get_thread_steps()
+
+    algorithm.cleanup()
+
+    return solve_time, steps_taken, reached_end
+
+
+if __name__ == '__main__':
+
+    # Choose the algorithms and maze to benchmark
+    maze = MazeGenerator.generate(size = 150, start_pos = 'top_left', end_pos = 'bottom_right', seed = 1)
+    algorithms = [WandererThreaded, WallHuggerThreaded]
+    num_threads = 4
+    max_steps = 200_000
+
+    print(f'CPU count: {os.cpu_count()}')
+    print(f'{"Algorithm":<20}{"Mode":<14}{"Time":>10}{"Thread Steps":>14}{"Steps/sec":>14}{"Solved":>8}')
+
+    for algorithm_class in algorithms:
+        for free_running in [False, True]:
+            solve_time, steps_taken, reached_end = measure(algorithm_class, maze, free_running, num_threads,
+                                                           max_steps)
+
+            print(f'{algorithm_class.__name__:<20}{"free-running" if free_running else "lockstep":<14}'
+                  f'{solve_time:>9.3f}s{steps_taken:>14}{steps_taken / solve_time:>14,.0f}'
+                  f'{"Yes" if reached_end else "No":>8}')
@@ -0,0 +1,16 @@
+import numpy as np
+
+from utils.maze_generator import Maze, MazeGenerator
+
+
+def gen_open_maze(size: int) -> Maze:
+    """ Generate a maze without any inner walls, where BFS frontiers grow with the size of the maze. """
+
+    matrix = np.full((size * 2 + 1, size * 2 + 1), MazeGenerator.path, dtype = np.uint8)
+    matrix[[0, -1], :] = matrix[:, [0, -1]] = MazeGenerator.wall
+
+    maze = Maze(matrix, 'top_left', 'bottom_right')
+    maze.wall = MazeGenerator.wall
+    maze.path = MazeGenerator.path
+
+    return maze
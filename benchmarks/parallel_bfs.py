@@ -0,0 +1,56 @@
+import os
+import time
+
+import numpy as np
+
+from utils.algorithms import BFSVectorized, BFSParallel
+from utils.maze_generator import Maze, MazeGenerator
+from benchmarks.mazes import gen_open_maze
+
+
+def measure(maze: Maze, num_workers: int | None, repeats: int) -> tuple[float, int]:
+    """ Measure the best time of solving a maze, returning it along with the number of explored spaces. """
+
+    best_time, explored = float('inf'), 0
+
+    for _ in range(repeats):
+        algorithm = BFSVectorized() if num_workers is None else BFSParallel()
+        if num_workers is None:
+            algorithm.setup(maze)
+        else:
+            algorithm.setup(maze, num_workers = num_workers)
+
+        solve_time = time.perf_counter()
+        algorithm.run()
+        best_time = min(best_time, time.perf_counter() - solve_time)
+        explored = int(np.count_nonzero(algorithm.memory['visited_mask']))
+
+        if num_workers is not None:
+            algorithm.cleanup()
+
+    return best_time, explored
+
+
+if __name__ == '__main__':
+
+    # Choose the mazes and thread counts to benchmark
+    mazes = {
+        'Spiral 1000' : MazeGenerator.generate(size = 1000, start_pos = 'top_left', end_pos = 'bottom_right',
+                                               vectorized = True, seed = 1),
+        'Open 1000' : gen_open_maze(1000)
+    }
+    thread_counts = [None, 1, 2, 4, 8]
+    repeats = 3
+
+    print(f'CPU count: {os.cpu_count()}')
+    print(f'{"Maze":<14}{"Workers":<14}{"Time":>10}{"Spaces/sec":>16}{"Speedup":>10}')
+
+    for name, maze in mazes.items():
+        base_time = None
+
+        for num_workers in thread_counts:
+            solve_time, explored = measure(maze, num_workers, repeats)
+            base_time = solve_time if base_time is None else base_time
+
+            print(f'{name:<14}{"vectorized" if num_workers is None else num_workers:<14}'
+                  f'{solve_time:>9.3f}s{explored / solve_time:>16,.0f}{base_time / solve_time:>9.2f}x')
@@ -0,0 +1,47 @@
+import os
+import time
+
+from utils.algorithms import BaseAlgorithmThreaded, WandererThreaded
+from utils.maze_generator import Maze
+from benchmarks.mazes import gen_open_maze
+
+
+class IdleThreaded(BaseAlgorithmThreaded):
+    """ Threaded algorithm that stays in place, so each step only costs the coordination between threads. """
+
+    def _step_logic(self, tid: int) -> tuple[int, int]:
+        return self.memory[tid]['current_pos']
+
+
+def measure(algorithm_class: type[BaseAlgorithmThreaded], maze: Maze, num_threads: int,
+            num_steps: int) -> tuple[float, int, int]:
+    """ Measure the average time of a single step, returning it along with the steps taken and threads used. """
+
+    algorithm = algorithm_class()
+    algorithm.setup(maze, num_threads = num_threads)
+
+    solve_time = time.perf_counter()
+    steps_taken, _, _ = algorithm.run(max_steps = num_steps)
+    solve_time = time.perf_counter() - solve_time
+
+    algorithm.cleanup()
+
+    return solve_time / max(steps_taken, 1), steps_taken, algorithm.num_threads
+
+
+if __name__ == '__main__':
+
+    # Choose the algorithms and thread counts to benchmark
+    maze = gen_open_maze(500)
+    algorithms = [IdleThreaded, WandererThreaded]
+    thread_counts = [1, 2, 4]
+    num_steps = 2000
+
+    print(f'CPU count: {os.cpu_count()}')
+    print(f'{"Algorithm":<20}{"Threads":<10}{"Steps":>8}{"Step Latency":>16}')
+
+    for algorithm_class in algorithms:
+        for num_threads in thread_counts:
+            step_time, steps_taken, used_threads = measure(algorithm_class, maze, num_threads, num_steps)
+
+            print(f'{algorithm_class.__name__:<20}{used_threads:<10}{steps_taken:>8}{step_time * 1e6:>14.1f}us')
@@ -0,0 +1,39 @@
+import pytest
+
+from utils.algorithms import WallHuggerMultiprocess, WandererMultiprocess
+from utils.maze_generator import MazeGenerator
+
+
+@pytest.fixture
+def maze():
+    return MazeGenerator.generate(size = 20, start_pos = 'top_left', end_pos = 'bottom_right', seed = 5)
+
+
+def test_accessors_after_cleanup(maze):
+    algorithm = WallHuggerMultiprocess()
+    algorithm.setup(maze, num_processes = 2)
+    algorithm.run()
+
+    visited_pos = set(algorithm.get_visited_pos())
+    current_pos = algorithm.get_current_pos()
+    status = algorithm.get_status()
+    algorithm.cleanup()
+
+    assert set(algorithm.get_visited_pos()) == visited_pos
+    assert len(algorithm.get_visited_pos()) == len(visited_pos)
+    assert algorithm.get_current_pos() == current_pos
+    assert algorithm.get_status() == status
+
+
+def test_accessors_after_cleanup_without_steps(maze):
+    algorithm = WandererMultiprocess()
+    algorithm.setup(maze, num_processes = 2)
+    algorithm.cleanup()
+
+    assert algorithm.get_current_pos() == [maze.start_pos] * algorithm.num_processes
+    assert len(algorithm.get_visited_pos()) == 1
+    assert maze.start_pos in algorithm.get_visited_pos()
+
+    # Cleaning up again (ex. when the object is deleted) keeps the copies
+    algorithm.cleanup()
+    assert len(algorithm.get_visited_pos()) == 1
@@ -0,0 +1,17 @@
+import numpy as np
+
+from utils.algorithms import VisitedPos
+
+
+def test_numpy_cell_ids():
+    visited_pos = VisitedPos(5)
+    visited_pos.add(np.int64(7))
+    visited_pos.add(np.int32(7))
+    visited_pos.update(np.array([8, 12]))
+    visited_pos.add((0, 1))
+
+    assert len(visited_pos) == 4
+    assert sorted(visited_pos) == [(0, 1), (1, 2), (1, 3), (2, 2)]
+    assert np.int64(8) in visited_pos
+    assert (2, 2) in visited_pos
+    assert 4 not in visited_pos
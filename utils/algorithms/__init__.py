@@ -3,3 +3,6 @@ from .wanderer import *
 from .wall_hugger import *
 from .bfs import *
 from .dfs import *
+from .bidirectional_bfs import *
+from .a_star import *
+from .dead_end_filler import *
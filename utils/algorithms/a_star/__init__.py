@@ -0,0 +1,2 @@
+from .a_star_sequential import *
+from .a_star_jps import *
\ No newline at end of file
@@ -0,0 +1,33 @@
+from typing import Iterator
+
+from .a_star_sequential import AStarSequential
+
+
+class AStarJPS(AStarSequential):
+    """
+    Implementation of the A* search algorithm with Jump Point Search.
+
+    Instead of adding every neighboring space to the open set, the search jumps in a straight line along
+    corridors until it reaches a jump point: a space where the corridor turns, branches or ends, or the end
+    of the maze. Only jump points are added to the open set, and the search never jumps back the way it came.
+    """
+
+    def _get_successors(self, flat: int, direction: int) -> Iterator[tuple[int, int, int]]:
+        flat_masks, offsets, end_flat = self.memory['flat_mask'], self.memory['offsets'], self.memory['end_flat']
+        flat_mask = flat_masks[flat]
+
+        for move in range(4):
+            if not flat_mask >> move & 1 or (direction >= 0 and move == direction ^ 1):
+                continue
+
+            straight = 1 << move | 1 << (move ^ 1)
+            next_flat, move_cost = flat + offsets[move], 1
+
+            while next_flat != end_flat and flat_masks[next_flat] == straight:
+                next_flat += offsets[move]
+                move_cost += 1
+
+            yield next_flat, move_cost, move
+
+
+__all__ = ['AStarJPS']
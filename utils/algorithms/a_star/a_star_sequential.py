@@ -0,0 +1,144 @@
+import heapq
+from array import array
+from typing import Iterator
+
+from utils.algorithms import BaseAlgorithmSequential
+from utils.maze_generator import Maze
+
+
+class AStarSequential(BaseAlgorithmSequential):
+    """
+    Sequential implementation of the A* search algorithm for maze solving.
+
+    A* always expands the open space with the lowest estimated total cost (steps taken so far plus the Manhattan
+    distance to the end), breaking ties in favor of spaces further from the start. The open set is a binary heap
+    of (estimate, -cost, space, direction, length) tuples over flat space indices, and the closed set is a byte
+    per space. Each step expands a single space.
+    """
+
+    deterministic = True
+
+
+    def setup(self, maze: Maze) -> None:
+        super().setup(maze)
+
+        width = maze.size_matrix
+        start_flat = maze.start_pos[0] * width + maze.start_pos[1]
+
+        self.memory['flat_mask'] = maze.neighbor_flat
+        self.memory['offsets'] = [move[0] * width + move[1] for move in Maze.moves]
+        self.memory['end_flat'] = maze.end_pos[0] * width + maze.end_pos[1]
+        self.memory['open_set'] = [(self._get_heuristic(start_flat), 0, start_flat, -1, 0)]
+        self.memory['closed_set'] = bytearray(width * width)
+        self.memory['costs'] = array('i', [-1]) * (width * width)
+        self.memory['costs'][start_flat] = 0
+        self.memory['expanded'] = 0
+        self.memory['last_move'] = -1, 0
+
+
+    def _get_heuristic(self, flat: int) -> int:
+        """ Get the Manhattan distance from a space to the end. """
+
+        row, col = divmod(flat, self.maze.size_matrix)
+        return abs(row - self.maze.end_pos[0]) + abs(col - self.maze.end_pos[1])
+
+
+    def _get_successors(self, flat: int, direction: int) -> Iterator[tuple[int, int, int]]:
+        """
+        Get the successors of a space.
+
+        Arguments:
+            flat: Flat index of the space being expanded.
+            direction: Index of the move (into `Maze.moves`) the space was reached with, or -1 for the start.
+
+        Returns:
+            An iterator over (successor flat index, cost, move index) tuples.
+        """
+
+        flat_mask, offsets = self.memory['flat_mask'][flat], self.memory['offsets']
+
+        for move in range(4):
+            if flat_mask >> move & 1:
+                yield flat + offsets[move], 1, move
+
+
+    def _prune_open_set(self) -> None:
+        """ Remove already expanded spaces from the top of the open set. """
+
+        open_set, closed_set = self.memory['open_set'], self.memory['closed_set']
+
+        while open_set and closed_set[open_set[0][2]]:
+            heapq.heappop(open_set)
+
+
+    def get_legal_moves(self, position: tuple[int, int] = None) -> list[tuple[int, int]]:
+        """
+        Get a list of legal moves from the open set or given position.
+
+        Arguments:
+            position: Specific position to check from, defaults to every space of the open set.
+
+        Returns:
+            A list of positions. If no legal moves exist, the list will be empty.
+        """
+
+        if self.is_at_end():
+            return []
+
+        if position is None:
+            width, closed_set = self.maze.size_matrix, self.memory['closed_set']
+            return [divmod(entry[2], width) for entry in self.memory['open_set'] if not closed_set[entry[2]]]
+
+        return self.maze.get_legal_moves(position)
+
+
+    def _has_legal_moves(self, position: tuple[int, int] = None) -> bool:
+        if position is None:
+            self._prune_open_set()
+            return len(self.memory['open_set']) > 0
+
+        return bool(self.maze.get_legal_moves(position))
+
+
+    def get_status(self) -> list[tuple[str, ...]]:
+        status = super().get_status()
+        status.append(('Open Set', f'[ly]{len(self.memory["open_set"])}[rs]'))
+        status.append(('Expanded Spaces', f'[ly]{self.memory["expanded"]}[rs]'))
+        return status
+
+
+    def _step_logic(self) -> tuple[int, int]:
+        open_set, closed_set, costs = self.memory['open_set'], self.memory['closed_set'], self.memory['costs']
+
+        self._prune_open_set()
+        _, neg_cost, flat, direction, length = heapq.heappop(open_set)
+        closed_set[flat] = 1
+        self.memory['expanded'] += 1
+        self.memory['last_move'] = direction, length
+
+        for next_flat, move_cost, move in self._get_successors(flat, direction):
+            if closed_set[next_flat]:
+                continue
+
+            cost = move_cost - neg_cost
+            if 0 <= costs[next_flat] <= cost:
+                continue
+
+            costs[next_flat] = cost
+            heapq.heappush(open_set, (cost + self._get_heuristic(next_flat), -cost, next_flat, move, move_cost))
+
+        return divmod(flat, self.maze.size_matrix)
+
+
+    def _after_step(self, new_pos: tuple[int, int]) -> None:
+        super()._after_step(new_pos)
+
+        # Spaces skipped over by moves longer than one space are also visited
+        direction, length = self.memory['last_move']
+        if length > 1:
+            row_move, col_move = Maze.moves[direction]
+            for distance in range(1, length):
+                self.memory['visited_pos'].add((new_pos[0] - row_move * distance, new_pos[1] - col_move * distance))
+
+
+__all__ = ['AStarSequential']
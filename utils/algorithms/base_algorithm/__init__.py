@@ -1,2 +1,8 @@
+from .visited_pos import *
+from .step_loop import *
 from .base_algorithm_sequential import *
 from .base_algorithm_threaded import *
+from .base_algorithm_junction import *
+from .base_algorithm_layered import *
+from .base_algorithm_multiprocess import *
+from .base_algorithm_async import *
\ No newline at end of file
@@ -0,0 +1,319 @@
+import asyncio
+import random
+from abc import abstractmethod, ABC
+
+from utils.maze_generator import Maze, DistanceField
+from .visited_pos import VisitedPos
+from .step_loop import StepLoopMixin
+
+
+class BaseAlgorithmAsync(StepLoopMixin, ABC):
+    """
+    Abstract representation of a maze solving algorithm run by many cooperative agents.
+
+    Each agent is a coroutine on an event loop owned by the algorithm, so an agent costs about 1.3 KB (its task,
+    coroutine and local memory) instead of an OS thread, and tens of thousands of them can solve the same maze.
+    All agents share the algorithm's memory, while `self.memory[aid]` is the local memory of agent `aid`. Agents
+    only switch at the end of a step, so no locks are needed.
+
+    Each step wakes every active agent once by resolving the `'tick'` future, and waits until the last agent is
+    done with its step. Agents that make random choices should draw them from `rng`, which is the `random` module
+    unless the MazeSolver is given a seed.
+    """
+
+    deterministic: bool = False
+    rng: random.Random = random
+    maze: Maze = None
+    num_agents: int = None
+    loop: asyncio.AbstractEventLoop = None
+    agents: list[asyncio.Task] = None
+    memory: dict[str | int, ...] = None
+
+
+    def setup(self, maze: Maze, num_agents: int = 1000) -> None:
+        """
+        Set up the algorithm.
+
+        Arguments:
+            maze: Instance of the Maze class.
+            num_agents: Number of agents.
+        """
+
+        self.cleanup()
+
+        self.maze = maze
+        self.maze.get_neighbor_mask()
+        self.num_agents = max(1, num_agents)
+        self.loop = asyncio.new_event_loop()
+        self.agents = []
+
+        self.memory = {
+            'visited_pos': VisitedPos(maze.size_matrix),
+            'reached_end': False,
+            'active_agents': self.num_agents,
+            'agent_steps': 0,
+            'tick': None,
+            'step_done': None,
+            'pending_steps': 0,
+            'stepped_agents': 0
+        }
+        self.memory['visited_pos'].add(maze.start_pos)
+
+        for aid in range(self.num_agents):
+            self.memory[aid] = {
+                'current_pos': maze.start_pos,
+                'is_active': True
+            }
+
+
+    def _start_agents(self) -> None:
+        """ Start all agents. """
+
+        self.memory['tick'] = self.loop.create_future()
+        self.agents = [self.loop.create_task(self._agent_loop(aid)) for aid in range(self.num_agents)]
+
+
+    async def _agent_loop(self, aid: int) -> None:
+        """ Internal agent logic - wait for each step and take it. """
+
+        local_memory = self.memory[aid]
+
+        while True:
+            await self.memory['tick']
+
+            try:
+                if self.memory['reached_end'] or not self.get_legal_moves(aid):
+                    local_memory['is_active'] = False
+                else:
+                    self._after_step(aid, self._step_logic(aid))
+                    self.memory['stepped_agents'] += 1
+
+                    # Agents later in the same step already see that the end has been reached
+                    self.is_at_end(aid)
+
+            except Exception:
+                local_memory['is_active'] = False
+                raise
+
+            finally:
+                if not local_memory['is_active']:
+                    self.memory['active_agents'] -= 1
+
+                # The step waits for every active agent, even one that ended or failed
+                self.memory['pending_steps'] -= 1
+                if self.memory['pending_steps'] == 0:
+                    self.memory['step_done'].set_result(None)
+
+            if not local_memory['is_active']:
+                break
+
+
+    async def _advance(self, num_steps: int | float) -> int:
+        """ Internal driver logic - take up to the given number of steps, returning the steps taken. """
+
+        steps_taken = 0
+
+        while steps_taken < num_steps and not self.memory['reached_end'] and self.memory['active_agents']:
+            tick = self.memory['tick']
+            self.memory['tick'] = self.loop.create_future()
+            self.memory['step_done'] = self.loop.create_future()
+            self.memory['pending_steps'] = self.memory['active_agents']
+            self.memory['stepped_agents'] = 0
+
+            tick.set_result(None)
+            await self.memory['step_done']
+
+            if self.memory['stepped_agents'] == 0:
+                break
+
+            self.memory['agent_steps'] += self.memory['stepped_agents']
+            steps_taken += 1
+
+        return steps_taken
+
+
+    def is_at_end(self, aid: int = None, position: tuple[int, int] = None) -> bool:
+        """
+        Check whether the current position of the given agent matches the maze end position.
+
+        Arguments:
+            aid: Agent ID.
+            position: Specific position to check from, defaults to the current position of the given agent.
+
+        Returns:
+            True if the specified position matches the end position, otherwise False.
+        """
+
+        position = self.memory[aid]['current_pos'] if position is None else position
+        reached_end = position == self.maze.end_pos
+
+        if reached_end:
+            self.memory['reached_end'] = True
+
+        return reached_end
+
+
+    def get_legal_moves(self, aid: int = None, position: tuple[int, int] = None) -> list[tuple[int, int]]:
+        """
+        Get a list of legal moves from the current position of the given agent.
+
+        Arguments:
+            aid: Agent ID.
+            position: Specific position to check from, defaults to the current position of the given agent.
+
+        Returns:
+            A list of new positions that can be visited from the specified or current agent position.
+            If no legal moves exist, the list will be empty.
+        """
+
+        if self.is_at_end(aid):
+            return []
+
+        position = self.memory[aid]['current_pos'] if position is None else position
+
+        return self.maze.get_legal_moves(position)
+
+
+    def get_current_pos(self, best_pos: bool = False) -> list[tuple[int, int]] | tuple[int, int]:
+        """
+        Get the current position of each agent or the one closest to the end.
+
+        Arguments:
+            best_pos: Whether to return the best position out of all agents.
+
+        Returns:
+            The coordinates of the current positions in the maze, or the position closest to the end if
+            best_pos is set to True.
+        """
+
+        positions = [self.memory[aid]['current_pos'] for aid in range(self.num_agents)]
+
+        if not best_pos:
+            return positions
+
+        distances = DistanceField.get(self.maze)
+        return min(positions, key = lambda position: distances[position])
+
+
+    def get_visited_pos(self) -> VisitedPos:
+        """
+        Get all the positions previously visited by the algorithm.
+
+        Returns:
+            A set-like collection of coordinates of all visited positions in the maze.
+        """
+
+        return self.memory['visited_pos']
+
+
+    def get_status(self) -> list[tuple[str, ...]]:
+        """
+        Get information about the algorithm's status.
+
+        Unlike threaded algorithms, agents aren't listed one by one since there can be thousands of them.
+
+        Returns:
+            A list with status information.
+        """
+
+        return [
+            ('Agents', f'[ly]{self.num_agents}[rs]'),
+            ('Active Agents', f'[ly]{self.memory["active_agents"]}[rs]'),
+            ('Best Pos', f'[ly]{self.get_current_pos(best_pos = True)}[rs]'),
+            ('Agent Steps', f'[ly]{self.memory["agent_steps"]}[rs]'),
+            ('Visited Pos', f'[ly]{len(self.memory["visited_pos"])}[rs]'),
+            ('Reached End', '[lg]Yes[rs]' if self.memory['reached_end'] else '[lr]No[rs]')
+        ]
+
+
+    def _take_step(self) -> bool:
+        """
+        Let every active agent take a step in the maze.
+
+        Returns:
+            True if any agent took a step, otherwise False.
+        """
+
+        return self._take_steps(1) == 1
+
+
+    def _take_steps(self, num_steps: int | float) -> int:
+        """
+        Take up to the given number of steps, all within a single run of the event loop.
+
+        Arguments:
+            num_steps: The maximum number of steps to take.
+
+        Returns:
+            The number of steps taken.
+        """
+
+        if not self.agents:
+            self._start_agents()
+
+        return self.loop.run_until_complete(self._advance(num_steps))
+
+
+    @abstractmethod
+    def _step_logic(self, aid: int) -> tuple[int, int]:
+        """
+        Logic for choosing the next move from the current position of an agent with the assumption that there's
+        at least one legal move from that position.
+
+        Arguments:
+            aid: ID of the agent calling this function.
+
+        Returns:
+            The new position after taking a step.
+        """
+
+        pass
+
+
+    def _after_step(self, aid: int, new_pos: tuple[int, int]) -> None:
+        """
+        Logic for updating the algorithm memory after an agent takes a step.
+
+        Arguments:
+            aid: ID of the agent calling this function.
+            new_pos: The new position after taking a step.
+        """
+
+        self.memory[aid]['current_pos'] = new_pos
+        self.memory['visited_pos'].add(new_pos)
+
+
+    def cleanup(self) -> None:
+        """ Cancel the agents and close the event loop. """
+
+        if self.loop is None or self.loop.is_closed():
+            return
+
+        for agent in self.agents:
+            agent.cancel()
+
+        if self.agents:
+            self.loop.run_until_complete(asyncio.gather(*self.agents, return_exceptions = True))
+
+        self.agents = []
+        self.loop.close()
+
+
+    def __del__(self):
+        """ Cleanup the agents and the event loop when object is deleted, unless an event loop is running. """
+
+        if self.loop is None or self.loop.is_closed() or self.loop.is_running():
+            return
+
+        # The garbage collector can run this while another algorithm's event loop is running, in which case this
+        # loop can't be run to process the cancelled agents
+        try:
+            asyncio.get_running_loop()
+            return
+        except RuntimeError:
+            pass
+
+        self.cleanup()
+
+
+__all__ = ['BaseAlgorithmAsync']
@@ -0,0 +1,94 @@
+from utils.maze_generator import Maze, JunctionGraph
+from .base_algorithm_sequential import BaseAlgorithmSequential
+
+
+class BaseAlgorithmJunction(BaseAlgorithmSequential):
+    """
+    Abstract representation of a sequential maze solving algorithm running on the junction graph of the maze.
+
+    Instead of moving one space per step, the algorithm moves from node to node (junctions, dead ends, start
+    and end) through whole corridors. Legal moves are the neighboring nodes of the current node, and the spaces
+    of every corridor walked through are added to the visited positions, so the results and the display keep
+    working with maze positions.
+    """
+
+    graph: JunctionGraph = None
+
+
+    def setup(self, maze: Maze) -> None:
+        """
+        Set up the algorithm.
+
+        Arguments:
+            maze: Instance of the Maze class.
+        """
+
+        super().setup(maze)
+        self.graph = JunctionGraph.get(maze)
+        self.memory['walked_spaces'] = 0
+
+
+    def get_legal_moves(self, position: tuple[int, int] = None) -> list[tuple[int, int]]:
+        """
+        Get a list of nodes reachable through a single corridor from the current or given node.
+
+        Arguments:
+            position: Specific node to check from, defaults to the current position.
+
+        Returns:
+            A list of neighboring node positions. If no legal moves exist, the list will be empty.
+        """
+
+        if self.is_at_end():
+            return []
+
+        position = self.memory['current_pos'] if position is None else position
+
+        return [node for node, _, _ in self.graph.get_edges(position)]
+
+
+    def _has_legal_moves(self, position: tuple[int, int] = None) -> bool:
+        position = self.memory['current_pos'] if position is None else position
+        return bool(self.graph.edges[self.graph.node_ids[position]])
+
+
+    def visit_corridor(self, position_a: tuple[int, int], position_b: tuple[int, int]) -> None:
+        """
+        Add the spaces of the corridor between two neighboring nodes to the visited positions.
+
+        Arguments:
+            position_a: Node the corridor is walked from.
+            position_b: Node the corridor is walked to.
+        """
+
+        path = self.graph.get_path(position_a, position_b)
+        if path is None:
+            return
+
+        self.memory['visited_pos'].update(JunctionGraph.expand(position_a, path))
+        self.memory['walked_spaces'] += len(path)
+
+
+    def get_status(self) -> list[tuple[str, ...]]:
+        status = super().get_status()
+        status.append(('Junction Nodes', f'[ly]{len(self.graph.nodes)}[rs]'))
+        status.append(('Walked Spaces', f'[ly]{self.memory["walked_spaces"]}[rs]'))
+        return status
+
+
+    def _after_step(self, new_pos: tuple[int, int]) -> None:
+        """
+        Logic for updating class variables and algorithm memory after taking a step.
+
+        If the new position is a neighboring node of the current one, the corridor between them is also visited.
+
+        Arguments:
+            new_pos: The new node position after taking a step.
+        """
+
+        self.visit_corridor(self.memory['current_pos'], new_pos)
+        self.memory['current_pos'] = new_pos
+        self.memory['visited_pos'].add(new_pos)
+
+
+__all__ = ['BaseAlgorithmJunction']
@@ -0,0 +1,145 @@
+from abc import abstractmethod
+
+import numpy as np
+
+from utils.maze_generator import Maze
+from .base_algorithm_sequential import BaseAlgorithmSequential
+
+
+class BaseAlgorithmLayered(BaseAlgorithmSequential):
+    """
+    Abstract representation of a level-synchronous Breadth-First Search algorithm.
+
+    Each step expands the whole frontier by one BFS layer at once and marks it as visited. The current position is
+    the end position once it's reached, otherwise the first space of the frontier. How a layer of spaces is stored
+    (ex. an array or a bitboard) is up to each algorithm, which only implements expanding a frontier
+    (`_get_next_layer()`) and the operations on a single layer.
+    """
+
+    deterministic = True
+
+
+    def setup(self, maze: Maze) -> None:
+        """
+        Set up the algorithm. The `'frontier'` key in the algorithm's memory should be set to a layer holding only
+        the start position.
+
+        Arguments:
+            maze: Instance of the Maze class.
+        """
+
+        super().setup(maze)
+        self.memory['frontier'] = None
+        self.memory['next_layer'] = None
+        self.memory['layer'] = 0
+
+
+    @abstractmethod
+    def _get_next_layer(self) -> np.ndarray | int:
+        """
+        Get the unvisited spaces next to the frontier, without marking them as visited.
+
+        Returns:
+            The next BFS layer.
+        """
+
+        pass
+
+
+    @abstractmethod
+    def _visit_layer(self, layer: np.ndarray | int) -> None:
+        """
+        Mark the spaces of a layer as visited, including the number of visited positions.
+
+        Arguments:
+            layer: A BFS layer.
+        """
+
+        pass
+
+
+    @abstractmethod
+    def _get_layer_size(self, layer: np.ndarray | int) -> int:
+        """ Get the number of spaces in a layer. """
+
+        pass
+
+
+    @abstractmethod
+    def _get_layer_positions(self, layer: np.ndarray | int) -> list[tuple[int, int]]:
+        """ Get the coordinates of each space in a layer, ordered by row and column. """
+
+        pass
+
+
+    @abstractmethod
+    def _get_layer_pos(self, layer: np.ndarray | int) -> tuple[int, int]:
+        """ Get the end position if a layer holds it, otherwise the first position of the layer. """
+
+        pass
+
+
+    def _peek_next_layer(self) -> np.ndarray | int:
+        """ Get the next BFS layer of the frontier, expanding the frontier only once per step. """
+
+        if self.memory['next_layer'] is None:
+            self.memory['next_layer'] = self._get_next_layer()
+
+        return self.memory['next_layer']
+
+
+    def get_legal_moves(self, position: tuple[int, int] = None) -> list[tuple[int, int]]:
+        """
+        Get a list of legal moves from the frontier or given position.
+
+        Arguments:
+            position: Specific position to check from, defaults to every space of the frontier.
+
+        Returns:
+            A list of unvisited positions reachable in one step. If no legal moves exist, the list will be empty.
+        """
+
+        if self.is_at_end():
+            return []
+
+        if position is None:
+            return self._get_layer_positions(self._peek_next_layer())
+
+        visited_pos = self.get_visited_pos()
+        return [move for move in self.maze.get_legal_moves(position) if move not in visited_pos]
+
+
+    def _has_legal_moves(self, position: tuple[int, int] = None) -> bool:
+        if position is None:
+            return self._get_layer_size(self._peek_next_layer()) > 0
+
+        return bool(self.get_legal_moves(position))
+
+
+    def get_status(self) -> list[tuple[str, ...]]:
+        return [
+            ('Current Pos', f'[ly]{self.memory["current_pos"]}[rs]'),
+            ('Visited Pos', f'[ly]{len(self.memory["visited_pos"])}[rs]'),
+            ('Reached End', '[lg]Yes[rs]' if self.memory['reached_end'] else '[lr]No[rs]'),
+            ('BFS Layer', f'[ly]{self.memory["layer"]}[rs]'),
+            ('Frontier Spaces', f'[ly]{self._get_layer_size(self.memory["frontier"])}[rs]')
+        ]
+
+
+    def _step_logic(self) -> tuple[int, int]:
+        layer = self._peek_next_layer()
+
+        self._visit_layer(layer)
+        self.memory['frontier'] = layer
+        self.memory['next_layer'] = None
+        self.memory['layer'] += 1
+
+        return self._get_layer_pos(layer)
+
+
+    def _after_step(self, new_pos: tuple[int, int]) -> None:
+        # The spaces of the layer are already marked as visited
+        self.memory['current_pos'] = new_pos
+
+
+__all__ = ['BaseAlgorithmLayered']
@@ -0,0 +1,413 @@
+import multiprocessing
+import os
+from abc import abstractmethod, ABC
+from multiprocessing import shared_memory
+from typing import Iterator
+
+import numpy as np
+
+from utils.maze_generator import Maze, DistanceField
+from .visited_pos import VisitedPos
+from .step_loop import StepLoopMixin
+
+
+class SharedVisitedPos(VisitedPos):
+    """
+    Visited positions stored as one byte per maze space in shared memory.
+
+    Each worker process adds positions through its own view, so the number of visited positions is counted from
+    the shared marks instead of being tracked by the view.
+    """
+
+    def __len__(self) -> int:
+        return int(np.count_nonzero(self.marks))
+
+
+    def __iter__(self) -> Iterator[tuple[int, int]]:
+        return (divmod(flat, self.width) for flat in np.flatnonzero(self.marks).tolist())
+
+
+class BaseAlgorithmMultiprocess(StepLoopMixin, ABC):
+    """
+    Abstract representation of a multiprocess maze solving algorithm.
+
+    Works like a threaded algorithm, but each worker is a separate process, so workers run on multiple cores
+    instead of being serialized by the GIL. The maze grid, the visited marks, the current positions of the workers
+    and the reached end flag live in shared memory. Everything else in the algorithm's memory is copied to each
+    worker when the processes are started (on the first step), after which `self.memory[wid]` is local to worker
+    `wid`.
+
+    Each call to `step()` lets every worker take up to `steps_per_sync` steps of its own before the workers
+    report back, since synchronizing processes costs far more than a single step.
+    """
+
+    deterministic: bool = False
+    min_processes: int = 1
+    is_worker: bool = False
+    maze: Maze = None
+    num_processes: int = None
+    steps_per_sync: int = None
+    processes: list[multiprocessing.Process] = None
+    connections: list = None
+    shared: dict[str, shared_memory.SharedMemory] = None
+    memory: dict[str | int, ...] = None
+
+
+    def setup(self, maze: Maze, num_processes: int = 4, steps_per_sync: int = 1) -> None:
+        """
+        Set up the algorithm.
+
+        Arguments:
+            maze: Instance of the Maze class.
+            num_processes: Number of worker processes, defaults to 4 or less (but never less than `min_processes`).
+            steps_per_sync: Number of steps each worker takes during a single step of the algorithm.
+        """
+
+        self.maze = maze
+        self.num_processes = min(num_processes, os.cpu_count()) if num_processes else min(4, os.cpu_count())
+        self.num_processes = max(self.num_processes, self.min_processes)
+        self.steps_per_sync = max(1, steps_per_sync)
+        self.processes = []
+        self.connections = []
+
+        width = maze.size_matrix
+        self.shared = {
+            'grid': shared_memory.SharedMemory(create = True, size = width * width),
+            'visited': shared_memory.SharedMemory(create = True, size = width * width),
+            'positions': shared_memory.SharedMemory(create = True, size = self.num_processes * 16),
+            'flags': shared_memory.SharedMemory(create = True, size = 1)
+        }
+
+        grid, visited, positions, flags = self._get_shared_arrays(width)
+        grid[:] = maze.grid
+        visited[:] = 0
+        positions[:] = maze.start_pos
+        flags[0] = 0
+
+        self.memory = {
+            'maze_info': (width, maze.start_pos, maze.end_pos, maze.wall, maze.path),
+            'visited_pos': SharedVisitedPos(width, visited),
+            'positions': positions,
+            'flags': flags,
+            'reached_end': False
+        }
+        self.memory['visited_pos'].add(maze.start_pos)
+
+        for wid in range(self.num_processes):
+            self.memory[wid] = {
+                'current_pos': maze.start_pos,
+                'is_active': True,
+                'steps_taken': 0
+            }
+
+
+    def _get_shared_arrays(self, width: int) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """ Get NumPy arrays over the shared memory blocks. """
+
+        return (
+            np.ndarray((width, width), dtype = np.uint8, buffer = self.shared['grid'].buf),
+            np.ndarray((width * width,), dtype = np.uint8, buffer = self.shared['visited'].buf),
+            np.ndarray((self.num_processes, 2), dtype = np.int64, buffer = self.shared['positions'].buf),
+            np.ndarray((1,), dtype = np.uint8, buffer = self.shared['flags'].buf)
+        )
+
+
+    def __getstate__(self) -> dict[str, ...]:
+        """ Get the algorithm state for starting a worker, with the shared memory blocks replaced by their names. """
+
+        state = self.__dict__.copy()
+        state['shared'] = {key: block.name for key, block in self.shared.items()}
+        state['maze'] = state['processes'] = state['connections'] = None
+        state['memory'] = {key: value for key, value in self.memory.items()
+                           if key not in ('visited_pos', 'positions', 'flags')}
+        return state
+
+
+    def _attach_worker(self) -> None:
+        """ Attach a worker process to the shared memory and rebuild the maze on top of the shared grid. """
+
+        self.is_worker = True
+
+        # Forked workers inherit the mapped blocks, spawned workers only get their names
+        self.shared = {key: self._attach_block(block) if isinstance(block, str) else block
+                       for key, block in self.shared.items()}
+
+        width, start_pos, end_pos, wall, path = self.memory['maze_info']
+        grid, visited, positions, flags = self._get_shared_arrays(width)
+
+        self.maze = Maze(grid, start_pos, end_pos)
+        self.maze.wall, self.maze.path = wall, path
+        self.maze.get_neighbor_mask()
+
+        self.memory['visited_pos'] = SharedVisitedPos(width, visited)
+        self.memory['positions'] = positions
+        self.memory['flags'] = flags
+
+
+    @staticmethod
+    def _attach_block(name: str) -> shared_memory.SharedMemory:
+        """ Attach to a shared memory block without taking ownership of it. """
+
+        # Only the parent process unlinks the shared memory blocks. Before Python 3.13 attaching always registers
+        # the block with the resource tracker, but workers share the tracker of the parent, so that's harmless
+        try:
+            return shared_memory.SharedMemory(name = name, track = False)
+        except TypeError:
+            return shared_memory.SharedMemory(name = name)
+
+
+    def _start_processes(self) -> None:
+        """ Start all worker processes. """
+
+        for wid in range(self.num_processes):
+            parent_connection, worker_connection = multiprocessing.Pipe()
+
+            process = multiprocessing.Process(
+                target = self._worker_loop,
+                args = (wid, worker_connection),
+                daemon = True
+            )
+
+            process.start()
+            self.processes.append(process)
+            self.connections.append(parent_connection)
+
+
+    def _worker_loop(self, wid: int, connection) -> None:
+        """ Internal worker logic - take the requested number of steps and report back until told to stop. """
+
+        self._attach_worker()
+        self._setup_worker(wid)
+
+        while True:
+            num_steps = connection.recv()
+            if num_steps is None:
+                break
+
+            steps_taken = 0
+            while steps_taken < num_steps and self.get_legal_moves(wid):
+                new_pos = self._step_logic(wid)
+                self._after_step(wid, new_pos)
+                steps_taken += 1
+
+            connection.send(steps_taken)
+
+        for block in self.shared.values():
+            block.close()
+
+
+    def _setup_worker(self, wid: int) -> None:
+        """
+        Logic for setting up a worker process before it takes any steps.
+
+        This function runs inside the worker process and should be overwritten if a worker needs to prepare
+        anything that can't be copied from the parent process (ex. seeding its random number generator).
+
+        Arguments:
+            wid: ID of the worker.
+        """
+
+        pass
+
+
+    def is_at_end(self, wid: int = None, position: tuple[int, int] = None) -> bool:
+        """
+        Check whether the current position of the given worker matches the maze end position.
+
+        Arguments:
+            wid: Worker ID.
+            position: Specific position to check from, defaults to the current position of the given worker.
+
+        Returns:
+            True if the specified position matches the end position, otherwise False.
+        """
+
+        position = self.memory[wid]['current_pos'] if position is None else position
+        reached_end = position == self.maze.end_pos
+
+        if reached_end:
+            self.memory['flags'][0] = 1
+
+        return reached_end or self.memory['flags'][0] == 1
+
+
+    def get_legal_moves(self, wid: int = None, position: tuple[int, int] = None) -> list[tuple[int, int]]:
+        """
+        Get a list of legal moves from the current position of the given worker.
+
+        Arguments:
+            wid: Worker ID.
+            position: Specific position to check from, defaults to the current position of the given worker.
+
+        Returns:
+            A list of new positions that can be visited from the specified or current worker position.
+            If no legal moves exist, the list will be empty.
+        """
+
+        if self.is_at_end(wid):
+            return []
+
+        position = self.memory[wid]['current_pos'] if position is None else position
+
+        return self.maze.get_legal_moves(position)
+
+
+    def get_current_pos(self, best_pos: bool = False) -> list[tuple[int, int]] | tuple[int, int]:
+        """
+        Get the current position of each worker or the one closest to the end.
+
+        Arguments:
+            best_pos: Whether to return the best position out of all workers.
+
+        Returns:
+            The coordinates of the current positions in the maze, or the position closest to the end if
+            best_pos is set to True.
+        """
+
+        positions = [(int(row), int(col)) for row, col in self.memory['positions']]
+
+        if not best_pos:
+            return positions
+
+        distances = DistanceField.get(self.maze)
+        return min(positions, key = lambda position: distances[position])
+
+
+    def get_visited_pos(self) -> SharedVisitedPos:
+        """
+        Get all the positions previously visited by the algorithm.
+
+        Returns:
+            A set-like view of the coordinates of all visited positions in the maze.
+        """
+
+        return self.memory['visited_pos']
+
+
+    def get_status(self) -> list[tuple[str, ...]]:
+        """
+        Get information about the algorithm's status.
+
+        Returns:
+            A list with status information.
+        """
+
+        status = []
+        positions = self.get_current_pos()
+
+        for wid in range(self.num_processes):
+            status.append((f'Process {wid}',
+                           '[lg]Active[rs]' if self.memory[wid]['is_active'] else '[lr]Inactive[rs]'))
+            status.append(('| Current Pos', f'[ly]{positions[wid]}[rs]'))
+            status.append(('| Steps Taken', f'[ly]{self.memory[wid]["steps_taken"]}[rs]'))
+
+        status.append(('Visited Pos', f'[ly]{len(self.memory["visited_pos"])}[rs]'))
+        status.append(('Reached End', '[lg]Yes[rs]' if self.memory['reached_end'] else '[lr]No[rs]'))
+
+        return status
+
+
+    def _take_step(self) -> bool:
+        """
+        Let every active worker take up to `steps_per_sync` steps in the maze.
+
+        Returns:
+            True if any worker took a step, otherwise False.
+        """
+
+        if not self.processes:
+            self._start_processes()
+
+        active_workers = [wid for wid in range(self.num_processes) if self.memory[wid]['is_active']]
+        for wid in active_workers:
+            self.connections[wid].send(self.steps_per_sync)
+
+        total_steps = 0
+        for wid in active_workers:
+            steps_taken = self.connections[wid].recv()
+            self.memory[wid]['steps_taken'] += steps_taken
+            total_steps += steps_taken
+
+            if steps_taken < self.steps_per_sync:
+                self.memory[wid]['is_active'] = False
+
+        self.memory['reached_end'] = bool(self.memory['flags'][0])
+
+        return total_steps > 0
+
+
+    @abstractmethod
+    def _step_logic(self, wid: int) -> tuple[int, int]:
+        """
+        Logic for choosing the next move from the current position of a worker with the assumption that there's
+        at least one legal move from that position.
+
+        This function runs inside the worker process. Changes to `self.memory[wid]` stay local to the worker,
+        while the visited positions are shared between all workers.
+
+        Arguments:
+            wid: ID of the worker calling this function.
+
+        Returns:
+            The new position after taking a step.
+        """
+
+        pass
+
+
+    def _after_step(self, wid: int, new_pos: tuple[int, int]) -> None:
+        """
+        Logic for updating the worker's memory and the shared memory after taking a step.
+
+        This function runs inside the worker process.
+
+        Arguments:
+            wid: ID of the worker calling this function.
+            new_pos: The new position after taking a step.
+        """
+
+        self.memory[wid]['current_pos'] = new_pos
+        self.memory['positions'][wid] = new_pos
+        self.memory['visited_pos'].add(new_pos)
+
+
+    def cleanup(self) -> None:
+        """ Stop the worker processes and release the shared memory. """
+
+        if self.is_worker:
+            return
+
+        for connection in self.connections or []:
+            try:
+                connection.send(None)
+            except (BrokenPipeError, OSError):
+                pass
+
+        for process in self.processes or []:
+            process.join(timeout = 0.5)
+            if process.is_alive():
+                process.terminate()
+
+        self.processes, self.connections = [], []
+
+        # The views over the shared memory are replaced by private copies, so the results stay readable
+        if self.shared is not None:
+            visited_pos = self.memory['visited_pos']
+            self.memory['visited_pos'] = SharedVisitedPos(visited_pos.width, visited_pos.marks.copy())
+            self.memory['positions'] = self.memory['positions'].copy()
+            self.memory['flags'] = self.memory['flags'].copy()
+
+        for block in (self.shared or {}).values():
+            block.close()
+            block.unlink()
+
+        self.shared = None
+
+
+    def __del__(self):
+        """ Stop the worker processes and release the shared memory when object is deleted. """
+
+        self.cleanup()
+
+
+__all__ = ['BaseAlgorithmMultiprocess', 'SharedVisitedPos']
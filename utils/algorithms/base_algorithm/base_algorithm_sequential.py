@@ -1,12 +1,32 @@
+import random
 from abc import abstractmethod, ABC
 
 from utils.maze_generator import Maze
+from .visited_pos import VisitedPos
+from .step_loop import StepLoopMixin
 
 
-class BaseAlgorithmSequential(ABC):
-    """ Abstract representation of a sequential maze solving algorithm. """
+class BaseAlgorithmSequential(StepLoopMixin, ABC):
+    """
+    Abstract representation of a sequential maze solving algorithm.
 
+    Algorithms that always take the same steps on the same maze should set `deterministic` to True, which allows
+    the MazeSolver to reuse their results instead of solving the same maze again.
+
+    Algorithms that set `cell_ids` to True work with integer cell IDs (see `Maze.get_cell()`) instead of position
+    tuples: the current position in memory, the positions passed to `is_at_end()` and `get_legal_moves()`, the
+    legal moves and the new position returned by `_step_logic()` are all cell IDs. `get_current_pos()` still
+    returns a position tuple, so the display and results don't need to know about cell IDs.
+
+    Algorithms that make random choices should draw them from `rng`, which is the `random` module unless the
+    MazeSolver is given a seed.
+    """
+
+    deterministic: bool = False
+    cell_ids: bool = False
+    rng: random.Random = random
     maze: Maze = None
+    end_pos: tuple[int, int] | int = None
     memory: dict[str, ...] = None
 
 
@@ -19,14 +39,17 @@ class BaseAlgorithmSequential(ABC):
         """
 
         self.maze = maze
+        self.maze.get_neighbor_mask()
+        self.end_pos = maze.get_cell(maze.end_pos) if self.cell_ids else maze.end_pos
         self.memory = {
-            'current_pos' : maze.start_pos,
-            'visited_pos' : {maze.start_pos},
+            'current_pos' : maze.get_cell(maze.start_pos) if self.cell_ids else maze.start_pos,
+            'visited_pos' : VisitedPos(maze.size_matrix),
             'reached_end' : False
         }
+        self.memory['visited_pos'].add(self.memory['current_pos'])
 
 
-    def is_at_end(self, position: tuple[int, int] = None) -> bool:
+    def is_at_end(self, position: tuple[int, int] | int = None) -> bool:
         """
         Check whether the current or given position matches the maze end position.
 
@@ -38,7 +61,7 @@ class BaseAlgorithmSequential(ABC):
         """
 
         position = self.memory['current_pos'] if position is None else position
-        reached_end = position == self.maze.end_pos
+        reached_end = position == self.end_pos
 
         if reached_end:
             self.memory['reached_end'] = True
@@ -46,7 +69,7 @@ class BaseAlgorithmSequential(ABC):
         return reached_end
 
 
-    def get_legal_moves(self, position: tuple[int, int] = None) -> list[tuple[int, int]]:
+    def get_legal_moves(self, position: tuple[int, int] | int = None) -> list[tuple[int, int]] | list[int]:
         """
         Get a list of legal moves from the current or given position.
 
@@ -63,18 +86,31 @@ class BaseAlgorithmSequential(ABC):
 
         position = self.memory['current_pos'] if position is None else position
 
-        check_moves = [
-            (position[0] - 1, position[1]),
-            (position[0] + 1, position[1]),
-            (position[0], position[1] - 1),
-            (position[0], position[1] + 1)
-        ]
+        if self.cell_ids:
+            return self.maze.get_legal_cells(position)
 
-        return [
-            move for move in check_moves
-            if 0 <= move[0] < self.maze.size_matrix and 0 <= move[1] < self.maze.size_matrix
-            and self.maze.matrix[move[0]][move[1]] == self.maze.path
-        ]
+        return self.maze.get_legal_moves(position)
+
+
+    def _has_legal_moves(self, position: tuple[int, int] | int = None) -> bool:
+        """
+        Check whether any legal moves exist from the current or given position, without checking for the end.
+
+        This function should be overwritten if `get_legal_moves()` is overwritten.
+
+        Arguments:
+            position: Specific position to check from, defaults to the current position.
+
+        Returns:
+            True if at least one legal move exists, otherwise False.
+        """
+
+        position = self.memory['current_pos'] if position is None else position
+
+        if self.cell_ids:
+            return self.maze.neighbor_flat[position] != 0
+
+        return self.maze.neighbor_flat[position[0] * self.maze.size_matrix + position[1]] != 0
 
 
     def get_current_pos(self) -> tuple[int, int]:
@@ -88,18 +124,35 @@ class BaseAlgorithmSequential(ABC):
             The coordinates of the current position in the maze.
         """
 
+        if self.cell_ids:
+            return divmod(self.memory['current_pos'], self.maze.size_matrix)
+
         return self.memory['current_pos']
 
 
-    def get_visited_pos(self) -> set[tuple[int, int]]:
+    def get_frontier_pos(self) -> list[tuple[int, int]]:
+        """
+        Get the positions of any additional search frontiers, shown alongside the current position.
+
+        This function should be overwritten if the algorithm searches from more than one position at a time.
+
+        Returns:
+            A list of coordinates in the maze, empty by default.
+        """
+
+        return []
+
+
+    def get_visited_pos(self) -> VisitedPos:
         """
         Get all the positions previously visited by the algorithm.
 
         This function should be overwritten if the `'visited_pos'` key in the algorithm's memory is modified.
-        Regardless of the modifications, the return type must remain the same.
+        Regardless of the modifications, it must return a set of positions or a set-like collection (see
+        `VisitedPos`).
 
         Returns:
-            A set of coordinates of all visited positions in the maze.
+            A set-like collection of coordinates of all visited positions in the maze.
         """
 
         return self.memory['visited_pos']
@@ -119,32 +172,31 @@ class BaseAlgorithmSequential(ABC):
         """
 
         return [
-            ('Current Pos', f'[ly]{self.memory["current_pos"]}[rs]'),
+            ('Current Pos', f'[ly]{self.get_current_pos()}[rs]'),
             ('Visited Pos', f'[ly]{len(self.memory["visited_pos"])}[rs]'),
             ('Reached End', '[lg]Yes[rs]' if self.memory['reached_end'] else '[lr]No[rs]')
         ]
 
 
-    def step(self) -> tuple[tuple[int, int] | None, bool]:
+    def _take_step(self) -> bool:
         """
-        Take a step in the maze.
+        Take a step in the maze, only checking for legal moves before the step and for the end after it.
 
         Returns:
-            The new position after taking a step or None if a step was not taken, and a boolean value
-            representing whether the end of the maze has been reached.
+            True if a step was taken, otherwise False.
         """
 
-        if not self.get_legal_moves():
-            return None, self.is_at_end()
+        if not self._has_legal_moves():
+            return False
 
-        new_pos = self._step_logic()
-        self._after_step(new_pos)
+        self._after_step(self._step_logic())
+        self.is_at_end()
 
-        return self.get_current_pos(), self.is_at_end()
+        return True
 
 
     @abstractmethod
-    def _step_logic(self) -> tuple[int, int]:
+    def _step_logic(self) -> tuple[int, int] | int:
         """
         Logic for choosing the next move from the current position with the assumption that there's at
         least one legal move from the current position.
@@ -163,7 +215,7 @@ class BaseAlgorithmSequential(ABC):
         pass
 
 
-    def _after_step(self, new_pos: tuple[int, int]) -> None:
+    def _after_step(self, new_pos: tuple[int, int] | int) -> None:
         """
         Logic for updating class variables and algorithm memory after taking a step.
 
@@ -181,4 +233,10 @@ class BaseAlgorithmSequential(ABC):
         self.memory['visited_pos'].add(new_pos)
 
 
+    def cleanup(self) -> None:
+        """ Release any resources held by the algorithm, nothing by default. """
+
+        pass
+
+
 __all__ = ['BaseAlgorithmSequential']
@@ -1,15 +1,35 @@
-import time
+import itertools
 import os
+import time
 from abc import abstractmethod, ABC
 import threading
+from typing import Callable
+
+from utils.maze_generator import Maze, DistanceField
+from .visited_pos import VisitedPos
+from .step_loop import StepLoopMixin
+
+
+class BaseAlgorithmThreaded(StepLoopMixin, ABC):
+    """
+    Abstract representation of a threaded maze solving algorithm.
 
-from utils.maze_generator import Maze
+    Each step sets the step flag of every active thread and waits on the `'step_done'` condition until the
+    `'pending_steps'` counter drops to zero, so threads sleep until they're needed and the step returns as soon as
+    the last thread is done.
 
+    In free-running mode (see `run_free()`), threads instead keep stepping on their own until the end is reached,
+    they run out of moves or the step budget is used up, without waiting for each other.
 
-class BaseAlgorithmThreaded(ABC):
-    """ Abstract representation of a threaded maze solving algorithm. """
+    Algorithms that set `cell_ids` to True work with integer cell IDs (see `Maze.get_cell()`) instead of position
+    tuples in the same way as sequential algorithms, while `get_current_pos()` still returns position tuples.
+    """
 
+    deterministic: bool = False
+    cell_ids: bool = False
+    min_threads: int = 1
     maze: Maze = None
+    end_pos: tuple[int, int] | int = None
     wait_for_flag: bool = None
     num_threads: int = None
     threads: list[threading.Thread] = None
@@ -22,27 +42,38 @@ class BaseAlgorithmThreaded(ABC):
 
         Arguments:
             maze: Instance of the Maze class.
-            wait_for_flag: Whether to wait for the step flag to be set for threads to execute their logic.
-            num_threads: Number of threads, defaults to 4 or less.
+            wait_for_flag: Kept for compatibility, threads always wait for their step flag to execute their logic.
+            num_threads: Number of threads, defaults to 4 or less (but never less than `min_threads`).
         """
 
         self.maze = maze
+        self.maze.get_neighbor_mask()
         self.wait_for_flag = wait_for_flag
         self.num_threads = min(num_threads, os.cpu_count()) if num_threads else min(4, os.cpu_count())
+        self.num_threads = max(self.num_threads, self.min_threads)
         self.threads = []
+        self.end_pos = maze.get_cell(maze.end_pos) if self.cell_ids else maze.end_pos
+        start_pos = maze.get_cell(maze.start_pos) if self.cell_ids else maze.start_pos
 
         self.memory = {
-            'visited_pos': {maze.start_pos},
+            'visited_pos': VisitedPos(maze.size_matrix),
             'reached_end': False,
-            'lock': threading.Lock()
+            'lock': threading.Lock(),
+            'step_done': threading.Condition(),
+            'pending_steps': 0,
+            'free_running': False,
+            'free_steps': None,
+            'max_free_steps': 0
         }
+        self.memory['visited_pos'].add(start_pos)
 
         for tid in range(self.num_threads):
             self.memory[tid] = {
-                'current_pos': maze.start_pos,
+                'current_pos': start_pos,
                 'is_active': True,
                 'step_flag': threading.Event(),
-                'response': None
+                'response': None,
+                'steps_taken': 0
             }
 
         self._start_threads()
@@ -62,7 +93,7 @@ class BaseAlgorithmThreaded(ABC):
             self.threads.append(thread)
 
 
-    def is_at_end(self, tid: int = None, position: tuple[int, int] = None) -> bool:
+    def is_at_end(self, tid: int = None, position: tuple[int, int] | int = None) -> bool:
         """
         Check whether the current position of the given thread matches the maze end position.
 
@@ -75,7 +106,7 @@ class BaseAlgorithmThreaded(ABC):
         """
 
         position = self.memory[tid]['current_pos'] if position is None else position
-        reached_end = position == self.maze.end_pos
+        reached_end = position == self.end_pos
 
         if reached_end:
             self.memory['reached_end'] = True
@@ -83,7 +114,8 @@ class BaseAlgorithmThreaded(ABC):
         return reached_end
 
 
-    def get_legal_moves(self, tid: int = None, position: tuple[int, int] = None) -> list[tuple[int, int]]:
+    def get_legal_moves(self, tid: int = None, position: tuple[int, int] | int = None
+                        ) -> list[tuple[int, int]] | list[int]:
         """
         Get a list of legal moves from the current position of the given thread.
 
@@ -101,18 +133,10 @@ class BaseAlgorithmThreaded(ABC):
 
         position = self.memory[tid]['current_pos'] if position is None else position
 
-        check_moves = [
-            (position[0] - 1, position[1]),
-            (position[0] + 1, position[1]),
-            (position[0], position[1] - 1),
-            (position[0], position[1] + 1)
-        ]
+        if self.cell_ids:
+            return self.maze.get_legal_cells(position)
 
-        return [
-            move for move in check_moves
-            if 0 <= move[0] < self.maze.size_matrix and 0 <= move[1] < self.maze.size_matrix
-            and self.maze.matrix[move[0]][move[1]] == self.maze.path
-        ]
+        return self.maze.get_legal_moves(position)
 
 
     def get_current_pos(self, best_pos: bool = False) -> list[tuple[int, int]] | tuple[int, int]:
@@ -130,30 +154,35 @@ class BaseAlgorithmThreaded(ABC):
             best_pos is set to True.
         """
 
+        positions = [self.memory[tid]['current_pos'] for tid in range(self.num_threads)]
+        if self.cell_ids:
+            positions = [divmod(cell, self.maze.size_matrix) for cell in positions]
+
         if not best_pos:
-            return [self.memory[tid]['current_pos'] for tid in range(self.num_threads)]
+            return positions
 
-        best_pos, best_dist = self.memory[0]['current_pos'], float('inf')
-        for tid in range(self.num_threads):
-            dist = abs(self.memory[tid]['current_pos'][0] - self.maze.end_pos[0]) + \
-                   abs(self.memory[tid]['current_pos'][1] - self.maze.end_pos[1])
+        distances = DistanceField.get(self.maze)
+        best_pos, best_dist = positions[0], float('inf')
+        for position in positions:
+            dist = distances[position]
 
             if dist < best_dist:
                 best_dist = dist
-                best_pos = self.memory[tid]['current_pos']
+                best_pos = position
 
         return best_pos
 
 
-    def get_visited_pos(self) -> set[tuple[int, int]]:
+    def get_visited_pos(self) -> VisitedPos:
         """
         Get all the positions previously visited by the algorithm.
 
         This function should be overwritten if the `'visited_pos'` key in the algorithm's memory is modified.
-        Regardless of the modifications, the return type must remain the same.
+        Regardless of the modifications, it must return a set of positions or a set-like collection (see
+        `VisitedPos`).
 
         Returns:
-            A set of coordinates of all visited positions in the maze.
+            A set-like collection of coordinates of all visited positions in the maze.
         """
 
         return self.memory['visited_pos']
@@ -173,15 +202,16 @@ class BaseAlgorithmThreaded(ABC):
         """
 
         status = []
+        positions = self.get_current_pos()
 
         for tid in range(self.num_threads):
             local_memory = self.memory[tid]
 
             status.append((f'Thread {tid}',
                            '[lg]Active[rs]' if local_memory['is_active'] else '[lr]Inactive[rs]'))
-            status.append(('| Current Pos', f'[ly]{local_memory["current_pos"]}[rs]'))
+            status.append(('| Current Pos', f'[ly]{positions[tid]}[rs]'))
             status.append(('| Step Flag',
-                           '[lg]Set[rs]' if local_memory["step_flag"] else '[lr]Unset[rs]'))
+                           '[lg]Set[rs]' if local_memory["step_flag"].is_set() else '[lr]Unset[rs]'))
 
             response = local_memory["response"]
             if response is None:
@@ -198,40 +228,60 @@ class BaseAlgorithmThreaded(ABC):
     def _thread_step(self, tid: int) -> None:
         """ Internal thread logic - keep threads alive and handle communication. """
 
+        local_memory = self.memory[tid]
+
         while True:
-            local_memory = self.memory[tid]
+            local_memory['step_flag'].wait()
+            local_memory['step_flag'].clear()
 
             if not local_memory['is_active']:
                 local_memory['response'] = 'Terminated'
                 break
 
-            if self.memory['reached_end']:
+            try:
+                if self.memory['reached_end']:
+                    local_memory['is_active'] = False
+                    local_memory['response'] = 'Ended'
+                elif self.memory['free_running']:
+                    local_memory['response'] = 'Running'
+                    self._free_run(tid)
+                    local_memory['response'] = 'Stepped'
+                else:
+                    local_memory['response'] = 'Stepping'
+                    new_pos = self._step_logic(tid)
+
+                    if new_pos is None:
+                        local_memory['response'] = 'Idle' if local_memory['is_active'] else 'Ended'
+                    else:
+                        self._after_step(tid, new_pos)
+                        local_memory['steps_taken'] += 1
+                        local_memory['response'] = 'Stepped'
+
+            except Exception:
                 local_memory['is_active'] = False
-                local_memory['response'] = 'Ended'
-                break
+                local_memory['response'] = 'Failed'
+                raise
 
-            self.memory[tid]['step_flag'].wait(timeout = 0.03 if not self.wait_for_flag else None)
-            self.memory[tid]['step_flag'].clear()
-            self.memory[tid]['response'] = 'Stepping'
+            finally:
+                # The step waits for every flagged thread, even one that ended or failed
+                with self.memory['step_done']:
+                    self.memory['pending_steps'] -= 1
+                    if self.memory['pending_steps'] == 0:
+                        self.memory['step_done'].notify()
 
-            new_pos = self._step_logic(tid)
-            self._after_step(tid, new_pos)
-            self.memory[tid]['response'] = 'Stepped'
+            if not local_memory['is_active']:
+                break
 
 
-    def step(self) -> tuple[tuple[tuple[int, int], ...] | None, bool]:
+    def _take_step(self) -> bool:
         """
-        Take a step in the maze.
+        Let every active thread take a step in the maze and wait until all of them are done.
 
         Returns:
-            The new positions after each thread takes a step or None if no steps were taken, and a boolean
-            value representing whether the end of the maze has been reached.
+            True if any thread took a step, otherwise False.
         """
 
-        if self.memory['reached_end']:
-            return None, True
-
-        active_threads = 0
+        active_threads = []
 
         for tid in range(self.num_threads):
 
@@ -239,33 +289,145 @@ class BaseAlgorithmThreaded(ABC):
                 continue
 
             if self.get_legal_moves(tid):
-                active_threads += 1
-                self.memory[tid]['step_flag'].set()
-                self.memory[tid]['response'] = 'Waiting'
+                active_threads.append(tid)
             else:
-                self.memory[tid]['step_flag'].clear()
                 self.memory[tid]['is_active'] = False
+                self.memory[tid]['step_flag'].set()
 
-        time_passed = time.time()
-        while True:
-            responses = sum(1 if self.memory[tid]['response'] == 'Stepped' else 0
-                            for tid in range(self.num_threads))
+        if not active_threads:
+            return False
+
+        steps_before = self.get_thread_steps()
+        self._wake_threads(active_threads)
+
+        # No thread moved, so none of them had anything left to do
+        if self.get_thread_steps() == steps_before and not self.memory['reached_end']:
+            return False
+
+        # Threads that are still active only exit once they see that the end has been reached
+        if self.memory['reached_end']:
+            self._wake_threads([tid for tid in range(self.num_threads) if self.memory[tid]['is_active']])
+
+        return True
+
+
+    def _free_run(self, tid: int) -> None:
+        """ Internal thread logic - keep taking steps without waiting for other threads. """
+
+        local_memory = self.memory[tid]
+        free_steps, max_free_steps = self.memory['free_steps'], self.memory['max_free_steps']
 
-            if responses == active_threads:
+        has_step = False
+
+        while local_memory['is_active'] and not self.memory['reached_end']:
+            if not self.get_legal_moves(tid):
+                local_memory['is_active'] = False
                 break
 
-            if time.time() - time_passed >= 0.1:
-                if responses >= 1:
-                    break
-                return None, self.memory['reached_end']
+            # Counting steps with a shared counter keeps the step budget exact without any locks
+            if max_free_steps and not has_step and next(free_steps) > max_free_steps:
+                break
+
+            new_pos = self._step_logic(tid)
+
+            # An idle thread keeps its step from the budget and lets the other threads run
+            if new_pos is None:
+                has_step = True
+                time.sleep(0)
+                continue
+
+            has_step = False
+            self._after_step(tid, new_pos)
+            local_memory['steps_taken'] += 1
+
+
+    def _wake_threads(self, tids: list[int]) -> None:
+        """ Set the step flags of the given threads and wait until all of them are done. """
+
+        step_done = self.memory['step_done']
+        with step_done:
+            self.memory['pending_steps'] = len(tids)
+
+            for tid in tids:
+                self.memory[tid]['response'] = 'Waiting'
+                self.memory[tid]['step_flag'].set()
+
+            step_done.wait_for(lambda: self.memory['pending_steps'] == 0)
+
+
+    def run_free(self, max_steps: int = 0, sample_interval: float = 0.1,
+                 on_progress: Callable[[int], None] = None) -> tuple[int, tuple[tuple[int, int], ...] | None, bool]:
+        """
+        Let every thread take steps on its own until the end of the maze is reached, no thread can take more steps,
+        or the step limit is hit.
+
+        Unlike `run()`, threads don't wait for each other after every step, so this measures the real throughput
+        of the algorithm. Steps are counted per thread, so a step of `step()` with 4 active threads counts as 4
+        steps here. The positions and visited positions can be sampled (ex. for a display) from `on_progress`
+        while the threads are running.
+
+        Arguments:
+            max_steps: The maximum number of steps taken by all threads together, 0 for unlimited.
+            sample_interval: Number of seconds between each call to on_progress.
+            on_progress: Function called with the total number of steps taken so far at each sample interval.
+
+        Returns:
+            The number of steps taken, the current positions or None if no steps were taken, and a boolean value
+            representing whether the end of the maze has been reached.
+        """
+
+        if self.memory['reached_end']:
+            return 0, None, True
+
+        active_threads = [tid for tid in range(self.num_threads) if self.memory[tid]['is_active']]
+        steps_before = self.get_thread_steps()
 
-            time.sleep(0.0001)
+        self.memory['free_running'] = True
+        self.memory['free_steps'] = itertools.count(1)
+        self.memory['max_free_steps'] = max_steps
 
-        return tuple(self.memory[tid]['current_pos'] for tid in range(self.num_threads)), self.memory['reached_end']
+        step_done = self.memory['step_done']
+        with step_done:
+            self.memory['pending_steps'] = len(active_threads)
+
+            for tid in active_threads:
+                self.memory[tid]['response'] = 'Waiting'
+                self.memory[tid]['step_flag'].set()
+
+            # Waiting with a timeout only wakes up the driver to sample progress, the threads never wait
+            while not step_done.wait_for(lambda: self.memory['pending_steps'] == 0, timeout = sample_interval):
+                if on_progress is not None:
+                    on_progress(self.get_thread_steps() - steps_before)
+
+        self.memory['free_running'] = False
+        steps_taken = self.get_thread_steps() - steps_before
+
+        if on_progress is not None:
+            on_progress(steps_taken)
+
+        # Threads that are still active only exit once they see that the end has been reached
+        if self.memory['reached_end']:
+            self._wake_threads([tid for tid in range(self.num_threads) if self.memory[tid]['is_active']])
+
+        if steps_taken == 0:
+            return 0, None, self.memory['reached_end']
+
+        return steps_taken, tuple(self.get_current_pos()), self.memory['reached_end']
+
+
+    def get_thread_steps(self) -> int:
+        """
+        Get the total number of steps taken by all threads.
+
+        Returns:
+            The sum of the steps taken by each thread, in both lockstep and free-running mode.
+        """
+
+        return sum(self.memory[tid]['steps_taken'] for tid in range(self.num_threads))
 
 
     @abstractmethod
-    def _step_logic(self, tid: int) -> tuple[int, int]:
+    def _step_logic(self, tid: int) -> tuple[int, int] | int | None:
         """
         Logic for choosing the next move from the current position with the assumption that there's at
         least one legal move from the current position.
@@ -277,17 +439,21 @@ class BaseAlgorithmThreaded(ABC):
         those changes. Regardless of the changes or the algorithm's logic, the function arguments and
         return type must remain the same.
 
+        A thread that has nothing to do for now (ex. waiting for work from other threads) returns None instead
+        of a position, in which case no step is counted. Once it has nothing left to do at all, it should also
+        set its `'is_active'` flag to False.
+
         Arguments:
             tid: ID of the thread calling this function.
 
         Returns:
-            The new position after taking a step.
+            The new position after taking a step, or None if the thread doesn't move.
         """
 
         pass
 
 
-    def _after_step(self, tid: int, new_pos: tuple[int, int]) -> None:
+    def _after_step(self, tid: int, new_pos: tuple[int, int] | int) -> None:
         """
         Logic for updating class variables and algorithm memory after taking a step.
 
@@ -309,8 +475,12 @@ class BaseAlgorithmThreaded(ABC):
     def cleanup(self) -> None:
         """ Cleanup threads and resources. """
 
+        if self.memory is None:
+            return
+
         for tid in range(self.num_threads):
             self.memory[tid]['is_active'] = False
+            self.memory[tid]['step_flag'].set()
 
         for thread in self.threads:
             thread.join(timeout = 0.5)
@@ -0,0 +1,126 @@
+from abc import abstractmethod
+from typing import Callable
+
+
+class StepLoopMixin:
+    """
+    Stepping loops shared by every kind of maze solving algorithm.
+
+    `step()`, `step_many()` and `run()` are all built on `_take_step()`, the single step primitive each base class
+    implements, and on the `'reached_end'` key of the algorithm's memory. Base classes that can take several
+    steps at a lower cost than one by one (ex. within a single run of an event loop) can also overwrite
+    `_take_steps()`.
+    """
+
+    memory: dict[str | int, ...] = None
+
+
+    @abstractmethod
+    def _take_step(self) -> bool:
+        """
+        Take a single step in the maze, with the assumption that the end hasn't been reached yet.
+
+        If the step reaches the end of the maze, the `'reached_end'` key in the algorithm's memory must be set.
+
+        Returns:
+            True if a step was taken, otherwise False.
+        """
+
+        pass
+
+
+    def _take_steps(self, num_steps: int | float) -> int:
+        """
+        Take steps until the step limit is hit, no more steps can be taken, or the end of the maze is reached.
+
+        Arguments:
+            num_steps: The maximum number of steps to take.
+
+        Returns:
+            The number of steps taken.
+        """
+
+        steps_taken = 0
+
+        while steps_taken < num_steps and not self.memory['reached_end'] and self._take_step():
+            steps_taken += 1
+
+        return steps_taken
+
+
+    def step(self) -> tuple[tuple[int, int] | tuple[tuple[int, int], ...] | None, bool]:
+        """
+        Take a step in the maze.
+
+        Returns:
+            The new position (or positions, if the algorithm moves more than one at once) after taking a step or
+            None if a step was not taken, and a boolean value representing whether the end of the maze has been
+            reached.
+        """
+
+        _, new_pos, reached_end = self.step_many(1)
+
+        return new_pos, reached_end
+
+
+    def step_many(self, num_steps: int | float
+                  ) -> tuple[int, tuple[int, int] | tuple[tuple[int, int], ...] | None, bool]:
+        """
+        Take multiple steps in the maze, the same as calling `step()` until it returns None or reaches the end.
+
+        Arguments:
+            num_steps: The maximum number of steps to take.
+
+        Returns:
+            The number of steps taken, the current position (or positions) or None if no more steps can be taken,
+            and a boolean value representing whether the end of the maze has been reached.
+        """
+
+        if self.memory['reached_end']:
+            return 0, None, True
+
+        steps_taken = self._take_steps(num_steps)
+
+        # A step that only found the end (ex. another thread got there first) doesn't count as a step
+        if steps_taken < num_steps and (steps_taken == 0 or not self.memory['reached_end']):
+            return steps_taken, None, self.memory['reached_end']
+
+        current_pos = self.get_current_pos()
+        if isinstance(current_pos, list):
+            current_pos = tuple(current_pos)
+
+        return steps_taken, current_pos, self.memory['reached_end']
+
+
+    def run(self, max_steps: int = 0, progress_interval: int = 0, on_progress: Callable[[int], None] = None
+            ) -> tuple[int, tuple[int, int] | tuple[tuple[int, int], ...] | None, bool]:
+        """
+        Take steps until the end of the maze is reached, no more steps can be taken, or the step limit is hit.
+
+        Arguments:
+            max_steps: The maximum number of steps to take, 0 for unlimited.
+            progress_interval: Number of steps between each call to on_progress, 0 for no progress reports.
+            on_progress: Function called with the total number of steps taken at each progress interval.
+
+        Returns:
+            The same as `step_many()`, for all steps taken.
+        """
+
+        steps_taken = 0
+
+        while True:
+            num_steps = progress_interval or max_steps or float('inf')
+            if max_steps:
+                num_steps = min(num_steps, max_steps - steps_taken)
+
+            new_steps, current_pos, reached_end = self.step_many(num_steps)
+            steps_taken += new_steps
+
+            if on_progress is not None and progress_interval:
+                on_progress(steps_taken)
+
+            if current_pos is None or reached_end or steps_taken == max_steps:
+                return steps_taken, current_pos, reached_end
+
+
+__all__ = ['StepLoopMixin']
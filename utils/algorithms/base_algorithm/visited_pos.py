@@ -0,0 +1,58 @@
+from typing import Iterable, Iterator
+
+import numpy as np
+
+
+class VisitedPos:
+    """
+    Set-like collection of visited positions stored as one byte per maze space.
+
+    A set of position tuples costs over 100 bytes per visited space, while this costs a single byte per space of
+    the maze matrix, visited or not. Supports `in`, `add()`, `update()`, `len()` and iteration over the positions,
+    so it can be used in place of a set of visited positions. Besides position tuples, `in`, `add()` and
+    `update()` also accept cell IDs (see `Maze.get_cell()`), including NumPy integers.
+    """
+
+    def __init__(self, width: int, marks: bytearray = None) -> None:
+        """
+        Initialize the collection.
+
+        Arguments:
+            width: Width of the maze matrix.
+            marks: Buffer of visited marks with one byte per space, defaults to a new buffer without any marks.
+        """
+
+        self.width = width
+        self.marks = bytearray(width * width) if marks is None else marks
+        self.num_visited = 0
+
+
+    def __contains__(self, position: tuple[int, int] | int) -> bool:
+        if isinstance(position, (int, np.integer)):
+            return self.marks[position] != 0
+
+        return self.marks[position[0] * self.width + position[1]] != 0
+
+
+    def add(self, position: tuple[int, int] | int) -> None:
+        flat = position if isinstance(position, (int, np.integer)) else position[0] * self.width + position[1]
+
+        if not self.marks[flat]:
+            self.marks[flat] = 1
+            self.num_visited += 1
+
+
+    def update(self, positions: Iterable[tuple[int, int] | int]) -> None:
+        for position in positions:
+            self.add(position)
+
+
+    def __len__(self) -> int:
+        return self.num_visited
+
+
+    def __iter__(self) -> Iterator[tuple[int, int]]:
+        return (divmod(flat, self.width) for flat, mark in enumerate(self.marks) if mark)
+
+
+__all__ = ['VisitedPos']
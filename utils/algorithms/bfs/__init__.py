@@ -1,2 +1,6 @@
 from .bfs_sequential import *
 from .bfs_threaded import *
+from .bfs_junction import *
+from .bfs_bitboard import *
+from .bfs_vectorized import *
+from .bfs_parallel import *
\ No newline at end of file
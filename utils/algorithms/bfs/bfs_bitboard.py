@@ -0,0 +1,63 @@
+import numpy as np
+
+from utils.algorithms import BaseAlgorithmLayered, VisitedPos
+from utils.maze_generator import Maze, Bitboard
+
+
+class BFSBitboard(BaseAlgorithmLayered):
+    """
+    Implementation of the Breadth-First Search algorithm using a bitboard of the maze.
+
+    Each layer is a board, expanded with a few big integer operations (see `Bitboard`). Visited positions are only
+    copied from the bitboard into their marks when requested.
+    """
+
+    bitboard: Bitboard = None
+
+
+    def setup(self, maze: Maze) -> None:
+        super().setup(maze)
+        self.bitboard = Bitboard.get(maze)
+
+        start = self.bitboard.from_positions([maze.start_pos])
+        self.memory['end_board'] = self.bitboard.from_positions([maze.end_pos])
+        self.memory['frontier'] = start
+        self.memory['visited_board'] = start
+        self.memory['visited_mask'] = np.frombuffer(self.memory['visited_pos'].marks, dtype = bool)
+        self.memory['visited_synced'] = True
+
+
+    def _get_next_layer(self) -> int:
+        return self.bitboard.expand(self.memory['frontier']) & ~self.memory['visited_board']
+
+
+    def _visit_layer(self, layer: int) -> None:
+        self.memory['visited_board'] |= layer
+        self.memory['visited_pos'].num_visited += layer.bit_count()
+        self.memory['visited_synced'] = False
+
+
+    def _get_layer_size(self, layer: int) -> int:
+        return layer.bit_count()
+
+
+    def _get_layer_positions(self, layer: int) -> list[tuple[int, int]]:
+        return self.bitboard.to_positions(layer)
+
+
+    def _get_layer_pos(self, layer: int) -> tuple[int, int]:
+        if layer & self.memory['end_board']:
+            return self.maze.end_pos
+
+        return self.bitboard.get_first_pos(layer)
+
+
+    def get_visited_pos(self) -> VisitedPos:
+        if not self.memory['visited_synced']:
+            self.memory['visited_mask'][:] = self.bitboard.to_array(self.memory['visited_board']).ravel()
+            self.memory['visited_synced'] = True
+
+        return self.memory['visited_pos']
+
+
+__all__ = ['BFSBitboard']
@@ -0,0 +1,44 @@
+from collections import deque
+
+from utils.algorithms import BaseAlgorithmJunction
+from utils.maze_generator import Maze
+
+
+class BFSJunction(BaseAlgorithmJunction):
+    """
+    Implementation of the Breadth-First Search algorithm running on the junction graph of the maze.
+
+    BFS explores all neighboring nodes at the current depth before moving to nodes at the next depth. Corridors
+    are visited when the nodes at their ends are discovered.
+    """
+
+    deterministic = True
+
+
+    def setup(self, maze: Maze) -> None:
+        super().setup(maze)
+        self.memory['queue'] = deque([maze.start_pos])
+
+
+    def _step_logic(self) -> tuple[int, int]:
+        new_pos = self.memory['queue'].popleft()
+
+        for move in self.get_legal_moves(new_pos):
+            if move not in self.memory['visited_pos']:
+                self.visit_corridor(new_pos, move)
+                self.memory['queue'].append(move)
+
+        return new_pos
+
+
+    def _after_step(self, new_pos: tuple[int, int]) -> None:
+        self.memory['current_pos'] = new_pos
+
+
+    def get_status(self) -> list[tuple[str, ...]]:
+        status = super().get_status()
+        status.append(('Queued Nodes', f'[ly]{len(self.memory["queue"])}[rs]'))
+        return status
+
+
+__all__ = ['BFSJunction']
@@ -0,0 +1,81 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from utils.maze_generator import Maze
+from .bfs_vectorized import BFSVectorized
+
+
+class BFSParallel(BFSVectorized):
+    """
+    Level-synchronous parallel implementation of the Breadth-First Search algorithm.
+
+    Each step splits the frontier into one partition per worker thread. Every worker expands its own partition
+    into a local next frontier, dropping spaces that were visited before this level and duplicates within the
+    partition, without taking any locks. Once all workers are done (the level barrier), the local frontiers are
+    merged into the next frontier and marked as visited. Most of the work happens inside NumPy operations, which
+    release the GIL, so the workers can run at the same time.
+
+    Frontiers smaller than `min_partition_size` are expanded directly, since splitting them costs more than
+    it saves.
+    """
+
+    executor: ThreadPoolExecutor = None
+
+
+    def setup(self, maze: Maze, num_workers: int = 4, min_partition_size: int = 2048) -> None:
+        """
+        Set up the algorithm.
+
+        Arguments:
+            maze: Instance of the maze being solved.
+            num_workers: Number of worker threads.
+            min_partition_size: Smallest frontier size that gets split between workers.
+        """
+
+        super().setup(maze)
+        self.memory['num_workers'] = max(1, num_workers)
+        self.memory['min_partition_size'] = min_partition_size
+        self.memory['parallel_levels'] = 0
+
+        self.cleanup()
+        if self.memory['num_workers'] > 1:
+            self.executor = ThreadPoolExecutor(max_workers = self.memory['num_workers'])
+
+
+    def _get_next_layer(self) -> np.ndarray:
+        frontier = self.memory['frontier']
+
+        if self.executor is None or len(frontier) < self.memory['min_partition_size']:
+            return self._expand(frontier)
+
+        partitions = np.array_split(frontier, self.memory['num_workers'])
+        local_layers = list(self.executor.map(self._expand, partitions))
+        self.memory['parallel_levels'] += 1
+
+        # Neighboring partitions can reach the same space, so the merged layer is deduplicated again
+        return np.unique(np.concatenate(local_layers))
+
+
+    def get_status(self) -> list[tuple[str, ...]]:
+        status = super().get_status()
+        status.append(('Workers', f'[ly]{self.memory["num_workers"]}[rs]'))
+        status.append(('Parallel Levels', f'[ly]{self.memory["parallel_levels"]}[rs]'))
+        return status
+
+
+    def cleanup(self) -> None:
+        """ Shut down the worker threads. """
+
+        if self.executor is not None:
+            self.executor.shutdown(wait = False)
+            self.executor = None
+
+
+    def __del__(self) -> None:
+        """ Shut down the worker threads when object is deleted. """
+
+        self.cleanup()
+
+
+__all__ = ['BFSParallel']
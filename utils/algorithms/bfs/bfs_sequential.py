@@ -9,12 +9,16 @@ class BFSSequential(BaseAlgorithmSequential):
     BFS explores all neighboring nodes at the current depth before moving to nodes at the next depth.
     """
 
+    deterministic = True
+    cell_ids = True
+
+
     def setup(self, maze: Maze) -> None:
         super().setup(maze)
-        self.memory['queue'] = [maze.start_pos]
+        self.memory['queue'] = [self.memory['current_pos']]
 
 
-    def _step_logic(self) -> tuple[int, int]:
+    def _step_logic(self) -> int:
         new_pos = self.memory['queue'].pop(0)
         legal_moves = self.get_legal_moves(new_pos)
 
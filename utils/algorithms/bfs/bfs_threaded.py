@@ -9,12 +9,15 @@ class BFSThreaded(BaseAlgorithmThreaded):
     BFS explores all neighboring nodes at the current depth before moving to nodes at the next depth.
     """
 
+    cell_ids = True
+
+
     def setup(self, maze: Maze, wait_for_flag: bool = False, num_threads: int = 4) -> None:
         super().setup(maze, wait_for_flag, num_threads)
-        self.memory['queue'] = [maze.start_pos]
+        self.memory['queue'] = [self.memory[0]['current_pos']]
 
 
-    def _step_logic(self, tid: int) -> tuple[int, int]:
+    def _step_logic(self, tid: int) -> int:
         new_pos = self.memory['queue'].pop(0)
         legal_moves = self.get_legal_moves(tid, new_pos)
 
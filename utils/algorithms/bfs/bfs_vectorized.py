@@ -0,0 +1,63 @@
+import numpy as np
+
+from utils.algorithms import BaseAlgorithmLayered
+from utils.maze_generator import Maze
+
+
+class BFSVectorized(BaseAlgorithmLayered):
+    """
+    Level-synchronous implementation of the Breadth-First Search algorithm using NumPy.
+
+    Each layer is an array of flat indices, expanded with array operations over the neighbor table of the maze
+    (see `Maze.get_neighbor_mask()`) and a visited mask, which is a view of the visited positions.
+    """
+
+    def setup(self, maze: Maze) -> None:
+        super().setup(maze)
+
+        width = maze.size_matrix
+        self.memory['neighbor_mask'] = maze.get_neighbor_mask().ravel()
+        self.memory['offsets'] = [move[0] * width + move[1] for move in Maze.moves]
+        self.memory['end_flat'] = maze.end_pos[0] * width + maze.end_pos[1]
+        self.memory['frontier'] = np.array([maze.start_pos[0] * width + maze.start_pos[1]], dtype = np.int64)
+        self.memory['visited_mask'] = np.frombuffer(self.memory['visited_pos'].marks, dtype = bool)
+
+
+    def _expand(self, frontier: np.ndarray) -> np.ndarray:
+        """ Get the flat indices of the unvisited neighbors of a frontier, without duplicates. """
+
+        frontier_mask = self.memory['neighbor_mask'][frontier]
+
+        layer = np.concatenate([
+            frontier[(frontier_mask >> move) & 1 == 1] + offset
+            for move, offset in enumerate(self.memory['offsets'])
+        ])
+
+        return np.unique(layer[~self.memory['visited_mask'][layer]])
+
+
+    def _get_next_layer(self) -> np.ndarray:
+        return self._expand(self.memory['frontier'])
+
+
+    def _visit_layer(self, layer: np.ndarray) -> None:
+        self.memory['visited_mask'][layer] = True
+        self.memory['visited_pos'].num_visited += len(layer)
+
+
+    def _get_layer_size(self, layer: np.ndarray) -> int:
+        return len(layer)
+
+
+    def _get_layer_positions(self, layer: np.ndarray) -> list[tuple[int, int]]:
+        return [divmod(flat, self.maze.size_matrix) for flat in layer.tolist()]
+
+
+    def _get_layer_pos(self, layer: np.ndarray) -> tuple[int, int]:
+        if self.memory['visited_mask'][self.memory['end_flat']]:
+            return self.maze.end_pos
+
+        return divmod(int(layer[0]), self.maze.size_matrix)
+
+
+__all__ = ['BFSVectorized']
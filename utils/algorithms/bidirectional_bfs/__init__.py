@@ -0,0 +1,2 @@
+from .bidirectional_bfs_sequential import *
+from .bidirectional_bfs_threaded import *
\ No newline at end of file
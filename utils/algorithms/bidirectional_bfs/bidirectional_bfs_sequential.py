@@ -0,0 +1,122 @@
+from collections import deque
+
+from utils.algorithms import BaseAlgorithmSequential
+from utils.maze_generator import Maze
+
+
+class BidirectionalBFSSequential(BaseAlgorithmSequential):
+    """
+    Sequential implementation of the bidirectional Breadth-First Search algorithm for maze solving.
+
+    Two BFS searches run at the same time, one from the start and one from the end of the maze, taking turns
+    with each step. The maze is solved when the two searches meet. The current position is the last position
+    of the search from the start (or the meeting position once they meet), and the last position of the search
+    from the end is reported as an additional frontier.
+    """
+
+    deterministic = True
+
+
+    def setup(self, maze: Maze) -> None:
+        super().setup(maze)
+        self.memory['visited_pos'].add(maze.end_pos)
+        self.memory['side'] = 0
+        self.memory['side_pos'] = [maze.start_pos, maze.end_pos]
+        self.memory['queues'] = [deque([maze.start_pos]), deque([maze.end_pos])]
+        self.memory['discovered'] = [{maze.start_pos}, {maze.end_pos}]
+        self.memory['meeting_pos'] = maze.end_pos if maze.start_pos == maze.end_pos else None
+
+
+    def is_at_end(self, position: tuple[int, int] = None) -> bool:
+        """
+        Check whether the two searches have met, or whether the given position matches the maze end position.
+
+        Arguments:
+            position: Specific position to check, defaults to checking whether the searches have met.
+
+        Returns:
+             True if the searches have met or the given position matches the end position, otherwise False.
+        """
+
+        if position is not None:
+            return position == self.maze.end_pos
+
+        if self.memory['meeting_pos'] is not None:
+            self.memory['reached_end'] = True
+
+        return self.memory['reached_end']
+
+
+    def get_legal_moves(self, position: tuple[int, int] = None) -> list[tuple[int, int]]:
+        """
+        Get a list of legal moves for the search taking the next step, or from the given position.
+
+        Arguments:
+            position: Specific position to check from, defaults to the queue of the search taking the next step.
+
+        Returns:
+            A list of positions. If no legal moves exist, the list will be empty.
+        """
+
+        if self.is_at_end():
+            return []
+
+        if position is None:
+            return list(self.memory['queues'][self.memory['side']])
+
+        return self.maze.get_legal_moves(position)
+
+
+    def _has_legal_moves(self, position: tuple[int, int] = None) -> bool:
+        if position is None:
+            return len(self.memory['queues'][self.memory['side']]) > 0
+
+        return bool(self.maze.get_legal_moves(position))
+
+
+    def get_frontier_pos(self) -> list[tuple[int, int]]:
+        return [self.memory['side_pos'][1]]
+
+
+    def get_status(self) -> list[tuple[str, ...]]:
+        status = super().get_status()
+        status.append(('Start Search Pos', f'[ly]{self.memory["side_pos"][0]}[rs]'))
+        status.append(('Start Queued Spaces', f'[ly]{len(self.memory["queues"][0])}[rs]'))
+        status.append(('End Search Pos', f'[ly]{self.memory["side_pos"][1]}[rs]'))
+        status.append(('End Queued Spaces', f'[ly]{len(self.memory["queues"][1])}[rs]'))
+        status.append(('Meeting Pos', f'[ly]{self.memory["meeting_pos"]}[rs]'))
+        return status
+
+
+    def _step_logic(self) -> tuple[int, int]:
+        side = self.memory['side']
+        new_pos = self.memory['queues'][side].popleft()
+        discovered, other_discovered = self.memory['discovered'][side], self.memory['discovered'][1 - side]
+
+        for move in self.maze.get_legal_moves(new_pos):
+            if move in other_discovered:
+                self.memory['meeting_pos'] = move
+                break
+
+            if move not in discovered:
+                discovered.add(move)
+                self.memory['queues'][side].append(move)
+
+        return new_pos
+
+
+    def _after_step(self, new_pos: tuple[int, int]) -> None:
+        side = self.memory['side']
+
+        self.memory['side_pos'][side] = new_pos
+        self.memory['visited_pos'].add(new_pos)
+        self.memory['side'] = 1 - side
+
+        if self.memory['meeting_pos'] is not None:
+            self.memory['current_pos'] = self.memory['meeting_pos']
+            self.memory['visited_pos'].add(self.memory['meeting_pos'])
+        else:
+            self.memory['current_pos'] = self.memory['side_pos'][0]
+
+
+__all__ = ['BidirectionalBFSSequential']
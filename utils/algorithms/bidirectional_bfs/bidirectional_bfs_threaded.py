@@ -0,0 +1,115 @@
+from collections import deque
+
+from utils.algorithms import BaseAlgorithmThreaded
+from utils.maze_generator import Maze
+
+
+class BidirectionalBFSThreaded(BaseAlgorithmThreaded):
+    """
+    Threaded implementation of the bidirectional Breadth-First Search algorithm for maze solving.
+
+    Thread 0 runs a BFS search from the start and thread 1 runs a BFS search from the end of the maze.
+    The maze is solved when the two searches meet.
+    """
+
+    min_threads = 2
+
+
+    def setup(self, maze: Maze, wait_for_flag: bool = False, num_threads: int = 4) -> None:
+        """
+        Set up the algorithm.
+
+        Arguments:
+            maze: Instance of the maze being solved.
+            wait_for_flag: Kept for compatibility, threads always wait for their step flag to execute their logic.
+            num_threads: Number of threads. Regardless of the value, only 2 threads are used.
+        """
+
+        super().setup(maze, wait_for_flag, num_threads = 2)
+        self.memory['visited_pos'].add(maze.end_pos)
+        self.memory[1]['current_pos'] = maze.end_pos
+        self.memory['queues'] = [deque([maze.start_pos]), deque([maze.end_pos])]
+        self.memory['discovered'] = [{maze.start_pos}, {maze.end_pos}]
+        self.memory['meeting_pos'] = maze.end_pos if maze.start_pos == maze.end_pos else None
+
+
+    def is_at_end(self, tid: int = None, position: tuple[int, int] = None) -> bool:
+        """
+        Check whether the two searches have met, or whether the given position matches the maze end position.
+
+        Arguments:
+            tid: Thread ID, unused since both threads reach the end when the searches meet.
+            position: Specific position to check, defaults to checking whether the searches have met.
+
+        Returns:
+            True if the searches have met or the given position matches the end position, otherwise False.
+        """
+
+        if position is not None:
+            return position == self.maze.end_pos
+
+        if self.memory.get('meeting_pos') is not None:
+            self.memory['reached_end'] = True
+
+        return self.memory['reached_end']
+
+
+    def get_legal_moves(self, tid: int = None, position: tuple[int, int] = None) -> list[tuple[int, int]]:
+        """
+        Get a list of legal moves for the search of the given thread, or from the given position.
+
+        Arguments:
+            tid: Thread ID.
+            position: Specific position to check from, defaults to the queue of the given thread's search.
+
+        Returns:
+            A list of positions. If no legal moves exist, the list will be empty.
+        """
+
+        if self.is_at_end(tid):
+            return []
+
+        if position is None:
+            return list(self.memory['queues'][tid]) if 'queues' in self.memory else []
+
+        return self.maze.get_legal_moves(position)
+
+
+    def get_status(self) -> list[tuple[str, ...]]:
+        status = super().get_status()
+        status.append(('Start Queued Spaces', f'[ly]{len(self.memory["queues"][0])}[rs]'))
+        status.append(('End Queued Spaces', f'[ly]{len(self.memory["queues"][1])}[rs]'))
+        status.append(('Meeting Pos', f'[ly]{self.memory["meeting_pos"]}[rs]'))
+        return status
+
+
+    def _step_logic(self, tid: int) -> tuple[int, int]:
+        # A search with nothing left in its queue stays in place
+        if not self.memory['queues'][tid]:
+            return self.memory[tid]['current_pos']
+
+        new_pos = self.memory['queues'][tid].popleft()
+        discovered, other_discovered = self.memory['discovered'][tid], self.memory['discovered'][1 - tid]
+
+        with self.memory['lock']:
+            for move in self.maze.get_legal_moves(new_pos):
+                if move in other_discovered:
+                    self.memory['meeting_pos'] = move
+                    self.memory['reached_end'] = True
+                    break
+
+                if move not in discovered:
+                    discovered.add(move)
+                    self.memory['queues'][tid].append(move)
+
+        return new_pos
+
+
+    def _after_step(self, tid: int, new_pos: tuple[int, int]) -> None:
+        super()._after_step(tid, new_pos)
+
+        if self.memory.get('meeting_pos') is not None:
+            self.memory['visited_pos'].add(self.memory['meeting_pos'])
+
+
+__all__ = ['BidirectionalBFSThreaded']
@@ -0,0 +1 @@
+from .dead_end_filler_vectorized import *
\ No newline at end of file
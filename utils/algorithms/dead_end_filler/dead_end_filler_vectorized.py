@@ -0,0 +1,124 @@
+import numpy as np
+
+from utils.algorithms import BaseAlgorithmSequential, VisitedPos
+from utils.maze_generator import Maze
+
+
+class DeadEndFillerVectorized(BaseAlgorithmSequential):
+    """
+    Vectorized implementation of the dead-end filling algorithm for maze solving.
+
+    Each step fills every current dead end (an open space with at most one open, unfilled neighbor, other than
+    the start and end) at once with NumPy operations. Filling a dead end can only turn its neighbors into new dead
+    ends, so each step only checks the neighbors of the spaces it filled. Once no dead ends are left, the unfilled
+    spaces are the path from the start to the end and the current position moves to the end.
+
+    Filled spaces are reported as visited positions, so the display shows the maze shrinking, and the filled mask
+    is a view of their marks. Otherwise, the current position is the first space filled during the last step.
+    """
+
+    deterministic = True
+
+
+    def setup(self, maze: Maze) -> None:
+        super().setup(maze)
+
+        width = maze.size_matrix
+        neighbor_mask = maze.get_neighbor_mask().ravel()
+        degrees = sum((neighbor_mask >> move) & 1 for move in range(4)).astype(np.int8)
+
+        protected = np.zeros(width * width, dtype = bool)
+        protected[[maze.start_pos[0] * width + maze.start_pos[1], maze.end_pos[0] * width + maze.end_pos[1]]] = True
+
+        self.memory['neighbor_mask'] = neighbor_mask
+        self.memory['offsets'] = [move[0] * width + move[1] for move in Maze.moves]
+        self.memory['degrees'] = degrees
+        self.memory['protected'] = protected
+        self.memory['visited_pos'] = VisitedPos(width)
+        self.memory['filled'] = np.frombuffer(self.memory['visited_pos'].marks, dtype = bool)
+        self.memory['dead_ends'] = np.flatnonzero((maze.grid.ravel() == maze.path) & (degrees <= 1) & ~protected)
+        self.memory['num_filled'] = 0
+
+
+    def get_legal_moves(self, position: tuple[int, int] = None) -> list[tuple[int, int]]:
+        """
+        Get a list of the dead ends to fill, or the legal moves from the given position.
+
+        Arguments:
+            position: Specific position to check from, defaults to the current dead ends.
+
+        Returns:
+            A list of positions. If no legal moves exist, the list will be empty.
+        """
+
+        if self.is_at_end():
+            return []
+
+        if position is None:
+            width = self.maze.size_matrix
+            return [divmod(flat, width) for flat in self.memory['dead_ends'].tolist()] or [self.maze.end_pos]
+
+        return self.maze.get_legal_moves(position)
+
+
+    def _has_legal_moves(self, position: tuple[int, int] = None) -> bool:
+        if position is None:
+            return True
+
+        return bool(self.maze.get_legal_moves(position))
+
+
+    def get_remaining_pos(self) -> set[tuple[int, int]]:
+        """
+        Get all open spaces that haven't been filled.
+
+        Once the end is reached, these are the spaces on the path from the start to the end.
+
+        Returns:
+            A set of coordinates in the maze.
+        """
+
+        width = self.maze.size_matrix
+        remaining = (self.maze.grid.ravel() == self.maze.path) & ~self.memory['filled']
+
+        return {divmod(flat, width) for flat in np.flatnonzero(remaining).tolist()}
+
+
+    def get_status(self) -> list[tuple[str, ...]]:
+        return [
+            ('Current Pos', f'[ly]{self.memory["current_pos"]}[rs]'),
+            ('Filled Spaces', f'[ly]{self.memory["num_filled"]}[rs]'),
+            ('Dead Ends', f'[ly]{len(self.memory["dead_ends"])}[rs]'),
+            ('Reached End', '[lg]Yes[rs]' if self.memory['reached_end'] else '[lr]No[rs]')
+        ]
+
+
+    def _step_logic(self) -> tuple[int, int]:
+        dead_ends = self.memory['dead_ends']
+        if len(dead_ends) == 0:
+            return self.maze.end_pos
+
+        neighbor_mask, degrees, filled = self.memory['neighbor_mask'], self.memory['degrees'], self.memory['filled']
+        filled[dead_ends] = True
+        self.memory['num_filled'] += len(dead_ends)
+        self.memory['visited_pos'].num_visited += len(dead_ends)
+
+        neighbors = np.concatenate([
+            dead_ends[(neighbor_mask[dead_ends] >> move) & 1 == 1] + offset
+            for move, offset in enumerate(self.memory['offsets'])
+        ])
+        neighbors = neighbors[~filled[neighbors]]
+        np.subtract.at(degrees, neighbors, 1)
+
+        neighbors = np.unique(neighbors)
+        self.memory['dead_ends'] = neighbors[(degrees[neighbors] <= 1) & ~self.memory['protected'][neighbors]]
+
+        return divmod(int(dead_ends[0]), self.maze.size_matrix)
+
+
+    def _after_step(self, new_pos: tuple[int, int]) -> None:
+        # Filled spaces are marked during the step, and the end position is never filled
+        self.memory['current_pos'] = new_pos
+
+
+__all__ = ['DeadEndFillerVectorized']
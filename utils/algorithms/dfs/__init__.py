@@ -1 +1,3 @@
 from .dfs_sequential import *
+from .dfs_threaded import *
+from .dfs_junction import *
\ No newline at end of file
@@ -9,12 +9,16 @@ class DFSSequential(BaseAlgorithmSequential):
     DFS explores as far as possible along each branch before backtracking.
     """
 
+    deterministic = True
+    cell_ids = True
+
+
     def setup(self, maze: Maze) -> None:
         super().setup(maze)
-        self.memory['stack'] = [maze.start_pos]
+        self.memory['stack'] = [self.memory['current_pos']]
 
 
-    def _step_logic(self) -> tuple[int, int]:
+    def _step_logic(self) -> int:
         legal_moves = self.get_legal_moves()
         unvisited_legal_moves = [move for move in legal_moves if move not in self.memory['visited_pos']]
 
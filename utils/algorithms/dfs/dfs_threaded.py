@@ -0,0 +1,124 @@
+from collections import deque
+
+from utils.algorithms import BaseAlgorithmThreaded
+from utils.maze_generator import Maze
+
+
+class DFSThreaded(BaseAlgorithmThreaded):
+    """
+    Threaded implementation of the Depth-First Search algorithm for maze solving with work-stealing.
+
+    Each thread runs its own DFS and owns a deque of branch points, the unvisited spaces it passed by. A thread
+    moves to the first unvisited neighbor of its current position and pushes the other ones onto the top of its
+    deque. Once it reaches a dead end, it jumps to the branch point on the top of its own deque, or steals the one
+    on the bottom of the fullest deque of another thread when its own is empty. Branch points on the bottom are
+    the oldest ones, so stolen branches tend to be the largest unexplored parts of the maze.
+
+    Deque operations on both ends are atomic, so threads never wait for a lock. Rarely, two threads can claim
+    the same space at once, which only costs a repeated step.
+
+    Threads that can't find a branch point anywhere stay idle without taking steps, since other threads can still
+    push new ones. Once every thread is idle, no branch points are left, and the threads stop.
+    """
+
+    cell_ids = True
+
+
+    def setup(self, maze: Maze, wait_for_flag: bool = False, num_threads: int = 4) -> None:
+        """
+        Set up the algorithm.
+
+        Arguments:
+            maze: Instance of the Maze class.
+            wait_for_flag: Kept for compatibility, threads always wait for their step flag to execute their logic.
+            num_threads: Number of threads, defaults to 4 or less.
+        """
+
+        super().setup(maze, wait_for_flag, num_threads)
+        for tid in range(self.num_threads):
+            self.memory[tid]['branches'] = deque()
+            self.memory[tid]['steals'] = 0
+            self.memory[tid]['idle'] = False
+
+
+    def _step_logic(self, tid: int) -> int | None:
+        local_memory = self.memory[tid]
+        visited_pos = self.memory['visited_pos']
+
+        unvisited_moves = [move for move in self.get_legal_moves(tid) if move not in visited_pos]
+        if unvisited_moves:
+            local_memory['branches'].extend(reversed(unvisited_moves[1:]))
+            new_pos = unvisited_moves[0]
+        else:
+            new_pos = self._get_branch(tid)
+
+        local_memory['idle'] = new_pos is None
+        if new_pos is None:
+            if all(self.memory[i]['idle'] or not self.memory[i]['is_active'] for i in range(self.num_threads)):
+                local_memory['is_active'] = False
+            return None
+
+        # Claiming the space right away keeps other threads from taking it during the same step
+        visited_pos.add(new_pos)
+        return new_pos
+
+
+    def _get_branch(self, tid: int) -> int | None:
+        """
+        Get the next unvisited branch point for a thread, stealing one from another thread if necessary.
+
+        Arguments:
+            tid: ID of the thread calling this function.
+
+        Returns:
+            The cell ID of the branch point, or None if no thread has any unvisited branch points left.
+        """
+
+        visited_pos = self.memory['visited_pos']
+        branches = self.memory[tid]['branches']
+
+        while branches:
+            try:
+                branch = branches.pop()
+            except IndexError:
+                break
+
+            if branch not in visited_pos:
+                return branch
+
+        while True:
+            victim = max((self.memory[i]['branches'] for i in range(self.num_threads) if i != tid),
+                         key = len, default = None)
+            if not victim:
+                return None
+
+            try:
+                branch = victim.popleft()
+            except IndexError:
+                continue
+
+            if branch not in visited_pos:
+                self.memory[tid]['steals'] += 1
+                return branch
+
+
+    def get_status(self) -> list[tuple[str, ...]]:
+        status = super().get_status()
+
+        offset = 0
+        for tid in range(self.num_threads):
+            status.insert(
+                4 * (tid + 1) + offset,
+                ('| Branches', f'[ly]{len(self.memory[tid]["branches"])}[rs]')
+            )
+
+            status.insert(
+                4 * (tid + 1) + offset + 1,
+                ('| Steals', f'[ly]{self.memory[tid]["steals"]}[rs]')
+            )
+            offset += 2
+
+        return status
+
+
+__all__ = ['DFSThreaded']
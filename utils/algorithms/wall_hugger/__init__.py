@@ -1,2 +1,3 @@
 from .wall_hugger_sequential import *
 from .wall_hugger_threaded import *
+from .wall_hugger_multiprocess import *
@@ -0,0 +1,62 @@
+from utils.algorithms.base_algorithm import BaseAlgorithmMultiprocess
+from utils.maze_generator import Maze
+from .wall_hugger_threaded import WallHuggerThreaded
+
+
+class WallHuggerMultiprocess(BaseAlgorithmMultiprocess):
+    """
+    Simple multiprocess algorithm that explores the maze by sticking to the left or right.
+
+    This version of the algorithm runs on two processes, one sticking to the left side and the other to the right side.
+    """
+
+    min_processes = 2
+    move_priorities = WallHuggerThreaded.move_priorities
+    move_to_facing = WallHuggerThreaded.move_to_facing
+
+
+    def setup(self, maze: Maze, num_processes: int = 4, steps_per_sync: int = 1) -> None:
+        """
+        Set up the algorithm.
+
+        Arguments:
+            maze: Instance of the Maze class.
+            num_processes: Number of worker processes. Regardless of the value, only 2 processes are used.
+            steps_per_sync: Number of steps each worker takes during a single step of the algorithm.
+        """
+
+        super().setup(maze, 2, steps_per_sync)
+
+        for wid in range(self.num_processes):
+            direction = 'left' if wid % 2 == 0 else 'right'
+            self.memory[wid]['direction'] = direction
+            self.memory[wid]['facing'] = direction
+
+
+    def _step_logic(self, wid: int) -> tuple[int, int]:
+        local_memory = self.memory[wid]
+        legal_moves = self.get_legal_moves(wid)
+        check_moves = self.move_priorities[local_memory['direction'][0] + local_memory['facing'][0]]
+        current_pos = local_memory['current_pos']
+
+        for move in check_moves:
+            new_pos = (current_pos[0] + move[0], current_pos[1] + move[1])
+            if new_pos not in legal_moves:
+                continue
+
+            local_memory['facing'] = self.move_to_facing[move]
+            return new_pos
+
+
+    def get_status(self) -> list[tuple[str, ...]]:
+        status = super().get_status()
+
+        offset = 0
+        for wid in range(self.num_processes):
+            status.insert(3 * (wid + 1) + offset, ('| Direction', f'[lg]{self.memory[wid]["direction"]}[rs]'))
+            offset += 1
+
+        return status
+
+
+__all__ = ['WallHuggerMultiprocess']
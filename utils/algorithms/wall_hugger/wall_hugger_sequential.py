@@ -11,6 +11,9 @@ class WallHuggerSequential(BaseAlgorithmSequential):
         - right: Always sticks to the right side.
     """
 
+    deterministic = True
+    cell_ids = True
+
     move_priorities = {
         'll' : ((1, 0), (0, -1), (-1, 0), (0, 1)),
         'ld' : ((0, 1), (1, 0), (0, -1), (-1, 0)),
@@ -45,13 +48,14 @@ class WallHuggerSequential(BaseAlgorithmSequential):
         self.memory['facing'] = direction
 
 
-    def _step_logic(self) -> tuple[int, int]:
+    def _step_logic(self) -> int:
         legal_moves = self.get_legal_moves()
         check_moves = self.move_priorities[self.memory['direction'][0] + self.memory['facing'][0]]
         current_pos = self.memory['current_pos']
+        width = self.maze.size_matrix
 
         for move in check_moves:
-            new_pos = (current_pos[0] + move[0], current_pos[1] + move[1])
+            new_pos = current_pos + move[0] * width + move[1]
             if new_pos not in legal_moves:
                 continue
 
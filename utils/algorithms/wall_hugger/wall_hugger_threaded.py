@@ -1,6 +1,3 @@
-import os
-import threading
-
 from utils.algorithms.base_algorithm import BaseAlgorithmThreaded
 from utils.maze_generator import Maze
 
@@ -12,6 +9,8 @@ class WallHuggerThreaded(BaseAlgorithmThreaded):
     This version of the algorithm runs on two threads, one sticking to the left side and the other to the right side.
     """
 
+    cell_ids = True
+
     move_priorities = {
         'll': ((1, 0), (0, -1), (-1, 0), (0, 1)),
         'ld': ((0, 1), (1, 0), (0, -1), (-1, 0)),
@@ -41,40 +40,23 @@ class WallHuggerThreaded(BaseAlgorithmThreaded):
             num_threads: Number of threads. Regardless of the value, only 2 threads are used.
         """
 
-        self.maze = maze
-        self.wait_for_flag = wait_for_flag
-        self.num_threads = min(2, os.cpu_count())
-        self.threads = []
-
-        self.memory = {
-            'visited_pos': {maze.start_pos},
-            'reached_end': False,
-            'lock': threading.Lock()
-        }
+        super().setup(maze, wait_for_flag, num_threads = 2)
 
         for tid in range(self.num_threads):
             direction = 'left' if tid % 2 == 0 else 'right'
-
-            self.memory[tid] = {
-                'current_pos': maze.start_pos,
-                'is_active': True,
-                'step_flag': threading.Event(),
-                'response': None,
-                'direction' : direction,
-                'facing' : direction
-            }
-
-        self._start_threads()
+            self.memory[tid]['direction'] = direction
+            self.memory[tid]['facing'] = direction
 
 
-    def _step_logic(self, tid: int) -> tuple[int, int]:
+    def _step_logic(self, tid: int) -> int:
         local_memory = self.memory[tid]
         legal_moves = self.get_legal_moves(tid)
         check_moves = self.move_priorities[local_memory['direction'][0] + local_memory['facing'][0]]
         current_pos = local_memory['current_pos']
+        width = self.maze.size_matrix
 
         for move in check_moves:
-            new_pos = (current_pos[0] + move[0], current_pos[1] + move[1])
+            new_pos = current_pos + move[0] * width + move[1]
             if new_pos not in legal_moves:
                 continue
 
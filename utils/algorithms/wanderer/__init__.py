@@ -1,2 +1,5 @@
 from .wanderer_sequential import *
 from .wanderer_threaded import *
+from .wanderer_multiprocess import *
+from .wanderer_async import *
+from .wanderer_vectorized import *
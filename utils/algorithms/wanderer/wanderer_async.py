@@ -0,0 +1,58 @@
+from utils.algorithms.base_algorithm import BaseAlgorithmAsync
+from utils.maze_generator import Maze
+
+
+class WandererAsync(BaseAlgorithmAsync):
+    """
+    Swarm of agents that explore the maze through random moves.
+
+    It has two modes:
+        - default: Makes random moves while avoiding previously visited spaces as much as possible.
+        - confused: Makes random moves without keeping track of visited spaces.
+    """
+
+    def setup(self, maze: Maze, num_agents: int = 1000, confused: bool = False) -> None:
+        """
+        Set up the algorithm.
+
+        Arguments:
+            maze: Instance of the Maze class.
+            num_agents: Number of agents.
+            confused: Whether the wanderers are confused.
+        """
+
+        super().setup(maze, num_agents)
+        for aid in range(self.num_agents):
+            self.memory[aid]['breadcrumbs'] = [maze.start_pos]
+        self.memory['confused'] = confused
+
+
+    def _step_logic(self, aid: int) -> tuple[int, int]:
+        local_memory = self.memory[aid]
+        legal_moves = self.get_legal_moves(aid)
+
+        if self.memory['confused']:
+            return self.rng.choice(legal_moves)
+
+        unvisited_spaces = [move for move in legal_moves if move not in self.memory['visited_pos']]
+        if unvisited_spaces:
+            move = self.rng.choice(unvisited_spaces)
+            local_memory['breadcrumbs'].append(move)
+
+        elif len(local_memory['breadcrumbs']) <= 1:
+            move = self.memory[self.rng.randrange(self.num_agents)]['current_pos']
+
+        else:
+            local_memory['breadcrumbs'].pop()
+            return local_memory['breadcrumbs'][-1]
+
+        return move
+
+
+    def get_status(self) -> list[tuple[str, ...]]:
+        status = super().get_status()
+        status.append(('Confused', '[lg]Yes[rs]' if self.memory['confused'] else '[lr]No[rs]'))
+        return status
+
+
+__all__ = ['WandererAsync']
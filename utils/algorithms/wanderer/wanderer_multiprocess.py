@@ -0,0 +1,68 @@
+import os
+import random
+
+from utils.algorithms.base_algorithm import BaseAlgorithmMultiprocess
+from utils.maze_generator import Maze
+
+
+class WandererMultiprocess(BaseAlgorithmMultiprocess):
+    """
+    Simple multiprocess algorithm that explores the maze through random moves.
+
+    It has two modes:
+        - default: Makes random moves while avoiding previously visited spaces as much as possible.
+        - confused: Makes random moves without keeping track of visited spaces.
+    """
+
+    def setup(self, maze: Maze, num_processes: int = 4, steps_per_sync: int = 1, confused: bool = False) -> None:
+        """
+        Set up the algorithm.
+
+        Arguments:
+            maze: Instance of the Maze class.
+            num_processes: Number of worker processes, defaults to 4 or less.
+            steps_per_sync: Number of steps each worker takes during a single step of the algorithm.
+            confused: Whether the wanderer is confused.
+        """
+
+        super().setup(maze, num_processes, steps_per_sync)
+        for wid in range(self.num_processes):
+            self.memory[wid]['breadcrumbs'] = [maze.start_pos]
+        self.memory['confused'] = confused
+
+
+    def _setup_worker(self, wid: int) -> None:
+        # Forked workers inherit the random state of the parent process, so they'd all make the same moves
+        random.seed(int.from_bytes(os.urandom(8), 'little') + wid)
+
+
+    def _step_logic(self, wid: int) -> tuple[int, int]:
+        local_memory = self.memory[wid]
+        legal_moves = self.get_legal_moves(wid)
+
+        if self.memory['confused']:
+            return random.choice(legal_moves)
+
+        unvisited_spaces = [move for move in legal_moves if move not in self.memory['visited_pos']]
+        if unvisited_spaces:
+            move = random.choice(unvisited_spaces)
+            local_memory['breadcrumbs'].append(move)
+
+        elif len(local_memory['breadcrumbs']) <= 1:
+            positions = self.get_current_pos()
+            move = random.choice([position for i, position in enumerate(positions) if i != wid] or positions)
+
+        else:
+            local_memory['breadcrumbs'].pop()
+            return local_memory['breadcrumbs'][-1]
+
+        return move
+
+
+    def get_status(self) -> list[tuple[str, ...]]:
+        status = super().get_status()
+        status.append(('Confused', '[lg]Yes[rs]' if self.memory['confused'] else '[lr]No[rs]'))
+        return status
+
+
+__all__ = ['WandererMultiprocess']
@@ -1,5 +1,3 @@
-import random
-
 from utils.algorithms.base_algorithm import BaseAlgorithmSequential
 from utils.maze_generator import Maze
 
@@ -13,6 +11,9 @@ class WandererSequential(BaseAlgorithmSequential):
         - confused: Makes random moves without keeping track of visited spaces.
     """
 
+    cell_ids = True
+
+
     def setup(self, maze: Maze, confused: bool = False) -> None:
         """
         Set up the algorithm.
@@ -23,19 +24,19 @@ class WandererSequential(BaseAlgorithmSequential):
         """
 
         super().setup(maze)
-        self.memory['breadcrumbs'] = [maze.start_pos]
+        self.memory['breadcrumbs'] = [self.memory['current_pos']]
         self.memory['confused'] = confused
 
 
-    def _step_logic(self) -> tuple[int, int]:
+    def _step_logic(self) -> int:
         legal_moves = self.get_legal_moves()
 
         if self.memory['confused']:
-            return random.choice(legal_moves)
+            return self.rng.choice(legal_moves)
 
         unvisited_spaces = [move for move in legal_moves if move not in self.memory['visited_pos']]
         if unvisited_spaces:
-            move = random.choice(unvisited_spaces)
+            move = self.rng.choice(unvisited_spaces)
             self.memory['breadcrumbs'].append(move)
             return move
 
@@ -14,6 +14,9 @@ class WandererThreaded(BaseAlgorithmThreaded):
         - confused: Makes random moves without keeping track of visited spaces.
     """
 
+    cell_ids = True
+
+
     def setup(self, maze: Maze, wait_for_flag: bool = False, num_threads: int = 4, confused: bool = False) -> None:
         """
         Set up the algorithm.
@@ -27,11 +30,11 @@ class WandererThreaded(BaseAlgorithmThreaded):
 
         super().setup(maze, wait_for_flag, num_threads)
         for tid in range(self.num_threads):
-            self.memory[tid]['breadcrumbs'] = [maze.start_pos]
+            self.memory[tid]['breadcrumbs'] = [self.memory[tid]['current_pos']]
         self.memory['confused'] = confused
 
 
-    def _step_logic(self, tid: int) -> tuple[int, int]:
+    def _step_logic(self, tid: int) -> int:
         random.seed(time.time() + tid)
         local_memory = self.memory[tid]
         legal_moves = self.get_legal_moves(tid)
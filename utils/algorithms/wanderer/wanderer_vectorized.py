@@ -0,0 +1,201 @@
+import random
+
+import numpy as np
+
+from utils.algorithms.base_algorithm import StepLoopMixin, VisitedPos
+from utils.maze_generator import Maze, DistanceField
+
+
+class WandererVectorized(StepLoopMixin):
+    """
+    Swarm of walkers that explore the maze through random moves, all advanced at once with NumPy.
+
+    It has two modes:
+        - default: Makes random moves while avoiding previously visited spaces as much as possible.
+        - confused: Makes random moves without keeping track of visited spaces.
+
+    The walker positions are an array of cell IDs (see `Maze.get_cell()`), and each step moves every walker using
+    the neighbor table of the maze (see `Maze.get_neighbor_mask()`) and a single batch of random draws. Since
+    walkers only step onto unvisited spaces, every space is first reached by a single walker, so the breadcrumbs
+    of all walkers are one shared array holding the space each space was reached from. Walkers that reach the
+    same unvisited space in the same step don't move, except for the first one. Walkers without any breadcrumbs
+    left jump to the position of another walker.
+
+    It uses the same interface as async algorithms, so `get_current_pos()` returns the positions of all walkers,
+    while the step loops come from `StepLoopMixin`.
+    The random draws are seeded from `rng`, so seeding the MazeSolver makes the walkers repeatable.
+    """
+
+    deterministic: bool = False
+    rng: random.Random = random
+    maze: Maze = None
+    num_walkers: int = None
+    generator: np.random.Generator = None
+    memory: dict[str, ...] = None
+
+
+    def setup(self, maze: Maze, num_walkers: int = 1000, confused: bool = False) -> None:
+        """
+        Set up the algorithm.
+
+        Arguments:
+            maze: Instance of the Maze class.
+            num_walkers: Number of walkers.
+            confused: Whether the wanderers are confused.
+        """
+
+        self.maze = maze
+        self.num_walkers = max(1, num_walkers)
+        self.generator = np.random.default_rng(self.rng.getrandbits(64))
+
+        width = maze.size_matrix
+        start_cell = maze.get_cell(maze.start_pos)
+        visited_pos = VisitedPos(width)
+
+        self.memory = {
+            'neighbor_mask': maze.get_neighbor_mask().ravel(),
+            'offsets': np.array([move[0] * width + move[1] for move in Maze.moves], dtype = np.int64)[:, None],
+            'move_bits': np.arange(len(Maze.moves), dtype = np.uint8)[:, None],
+            'end_cell': maze.get_cell(maze.end_pos),
+            'positions': np.full(self.num_walkers, start_cell, dtype = np.int64),
+            'breadcrumbs': np.full(width * width, -1, dtype = np.int64),
+            'depths': np.zeros(width * width, dtype = np.int32),
+            'visited_pos': visited_pos,
+            'visited_mask': np.frombuffer(visited_pos.marks, dtype = np.uint8),
+            'reached_end': maze.start_pos == maze.end_pos,
+            'confused': confused,
+            'walker_steps': 0,
+            'collisions': 0
+        }
+        visited_pos.add(start_cell)
+
+
+    def _take_step(self) -> bool:
+        """
+        Move every walker once.
+
+        Returns:
+            True if any walker moved, otherwise False.
+        """
+
+        memory = self.memory
+        positions = memory['positions']
+        visited_mask = memory['visited_mask']
+        walkers = np.arange(self.num_walkers)
+
+        # Open moves of every walker, one row per move direction
+        neighbors = positions + memory['offsets']
+        open_moves = ((memory['neighbor_mask'][positions] >> memory['move_bits']) & 1).astype(bool)
+        if not memory['confused']:
+            open_moves &= visited_mask[neighbors] == 0
+
+        # Pick a random open move for each walker that has any
+        num_open = open_moves.sum(axis = 0)
+        draws = (self.generator.random(self.num_walkers) * num_open).astype(np.int64)
+        moves = (open_moves.cumsum(axis = 0) > draws).argmax(axis = 0)
+        targets = neighbors[moves, walkers]
+        movers = np.flatnonzero(num_open)
+
+        if memory['confused']:
+            new_cells = np.unique(targets[movers][visited_mask[targets[movers]] == 0])
+            positions[movers] = targets[movers]
+            num_moved = len(movers)
+
+        else:
+            # Only the first walker that steps onto a space claims it and leaves its breadcrumb there
+            new_cells, first = np.unique(targets[movers], return_index = True)
+            winners = movers[first]
+            memory['breadcrumbs'][new_cells] = positions[winners]
+            memory['depths'][new_cells] = memory['depths'][positions[winners]] + 1
+            memory['collisions'] += len(movers) - len(winners)
+
+            stuck = np.flatnonzero(num_open == 0)
+            back = memory['breadcrumbs'][positions[stuck]]
+
+            lost = np.flatnonzero(back < 0)
+            if len(lost) and self.num_walkers > 1:
+                others = self.generator.integers(self.num_walkers - 1, size = len(lost))
+                others += others >= stuck[lost]
+                back[lost] = positions[others]
+            else:
+                back[lost] = positions[stuck[lost]]
+
+            num_moved = len(winners) + int(np.count_nonzero(back != positions[stuck]))
+            positions[winners] = new_cells
+            positions[stuck] = back
+
+        visited_mask[new_cells] = 1
+        memory['visited_pos'].num_visited += len(new_cells)
+
+        if visited_mask[memory['end_cell']]:
+            memory['reached_end'] = True
+
+        memory['walker_steps'] += num_moved
+
+        return num_moved > 0
+
+
+    def get_current_pos(self, best_pos: bool = False) -> list[tuple[int, int]] | tuple[int, int]:
+        """
+        Get the current position of each walker or the one closest to the end.
+
+        Arguments:
+            best_pos: Whether to return the best position out of all walkers.
+
+        Returns:
+            The coordinates of the current positions in the maze, or the position closest to the end if
+            best_pos is set to True.
+        """
+
+        width = self.maze.size_matrix
+
+        if not best_pos:
+            return [divmod(cell, width) for cell in self.memory['positions'].tolist()]
+
+        if self.memory['reached_end']:
+            return self.maze.end_pos
+
+        distances = DistanceField.get(self.maze).ravel()[self.memory['positions']]
+        return divmod(int(self.memory['positions'][distances.argmin()]), width)
+
+
+    def get_visited_pos(self) -> VisitedPos:
+        """
+        Get all the positions previously visited by the algorithm.
+
+        Returns:
+            A set-like collection of coordinates of all visited positions in the maze.
+        """
+
+        return self.memory['visited_pos']
+
+
+    def get_status(self) -> list[tuple[str, ...]]:
+        """
+        Get information about the algorithm's status.
+
+        Like async algorithms, walkers aren't listed one by one since there can be thousands of them.
+
+        Returns:
+            A list with status information.
+        """
+
+        return [
+            ('Walkers', f'[ly]{self.num_walkers}[rs]'),
+            ('Best Pos', f'[ly]{self.get_current_pos(best_pos = True)}[rs]'),
+            ('Walker Steps', f'[ly]{self.memory["walker_steps"]}[rs]'),
+            ('Collisions', f'[ly]{self.memory["collisions"]}[rs]'),
+            ('Longest Trail', f'[ly]{int(self.memory["depths"][self.memory["positions"]].max()) + 1}[rs]'),
+            ('Visited Pos', f'[ly]{len(self.memory["visited_pos"])}[rs]'),
+            ('Reached End', '[lg]Yes[rs]' if self.memory['reached_end'] else '[lr]No[rs]'),
+            ('Confused', '[lg]Yes[rs]' if self.memory['confused'] else '[lr]No[rs]')
+        ]
+
+
+    def cleanup(self) -> None:
+        """ Release any resources held by the algorithm, nothing since walkers are only arrays. """
+
+        pass
+
+
+__all__ = ['WandererVectorized']
@@ -89,8 +89,8 @@ class Display:
 
         current_pos = self.algorithm.get_current_pos() if isinstance(self.algorithm, BaseAlgorithmSequential) \
             else self.algorithm.get_current_pos(best_pos = True)
-        thread_pos = self.algorithm.get_current_pos() if isinstance(self.algorithm, BaseAlgorithmThreaded) \
-            else []
+        thread_pos = set(self.algorithm.get_frontier_pos() if isinstance(self.algorithm, BaseAlgorithmSequential)
+                         else self.algorithm.get_current_pos())
         visited_pos = self.algorithm.get_visited_pos()
 
         bound_t, bound_l, bound_b, bound_r = self.maze_bound
@@ -114,6 +114,7 @@ class Display:
             start_col = max(0, maze_cols - visible_cols)
 
         color_code = 0 if coloring else 1
+        window = self.maze.matrix[start_row:start_row + box_h, start_col:start_col + visible_cols]
 
         for row in range(box_h):
             maze_row = start_row + row
@@ -131,7 +132,7 @@ class Display:
                     char = self.char_curr
                 elif pos == self.maze.end_pos:
                     char = self.char_end
-                elif self.maze.matrix[maze_row][maze_col] == self.maze.wall:
+                elif window[row, maze_col_idx] == self.maze.wall:
                     char = self.char_wall
                 elif pos in visited_pos:
                     char = self.char_vist
@@ -1,2 +1,8 @@
 from .maze_generator import *
 from .maze import *
+from .maze_file import *
+from .packed_maze import *
+from .stream_generator import *
+from .junction_graph import *
+from .distance_field import *
+from .bitboard import *
\ No newline at end of file
@@ -0,0 +1,234 @@
+from typing import Iterator
+
+import numpy as np
+
+from .maze import Maze
+
+
+class Bitboard:
+    """
+    Flood fill engine storing sets of maze spaces as bits of a single Python integer.
+
+    Bit `row * size_matrix + col` represents the space at (row, col) of the maze matrix. Expanding a set of spaces
+    by one step in every direction is a handful of shifts and masks over the whole maze, so each BFS layer costs
+    a few big integer operations regardless of how many spaces the layer holds. Shifting left or right can wrap
+    around rows, but the outer walls of the maze are never part of the path mask, so wrapped bits are always
+    masked out.
+    """
+
+    def __init__(self, maze: Maze) -> None:
+        """
+        Build the bitboard of a maze.
+
+        Arguments:
+            maze: Instance of the Maze class.
+        """
+
+        self.maze = maze
+        self.width = maze.size_matrix
+        self.num_spaces = self.width * self.width
+
+        self.paths = self.from_array(maze.grid == maze.path)
+
+
+    @staticmethod
+    def get(maze: Maze) -> 'Bitboard':
+        """
+        Get the bitboard of a maze, building it only on the first call for that maze.
+
+        Arguments:
+            maze: Instance of the Maze class.
+
+        Returns:
+            A Bitboard object.
+        """
+
+        if maze.bitboard is None:
+            maze.bitboard = Bitboard(maze)
+
+        return maze.bitboard
+
+
+    def from_array(self, array: np.ndarray) -> int:
+        """
+        Convert a boolean array shaped like the maze matrix into a board.
+
+        Arguments:
+            array: The boolean array.
+
+        Returns:
+            The board as an integer.
+        """
+
+        return int.from_bytes(np.packbits(array.ravel(), bitorder = 'little').tobytes(), 'little')
+
+
+    def to_array(self, board: int) -> np.ndarray:
+        """
+        Convert a board into a boolean array shaped like the maze matrix.
+
+        Arguments:
+            board: The board as an integer.
+
+        Returns:
+            The boolean NumPy array.
+        """
+
+        data = np.frombuffer(board.to_bytes((self.num_spaces + 7) // 8, 'little'), dtype = np.uint8)
+        bits = np.unpackbits(data, bitorder = 'little')[:self.num_spaces]
+
+        return bits.view(bool).reshape(self.width, self.width)
+
+
+    def from_positions(self, positions: Iterator[tuple[int, int]]) -> int:
+        """
+        Convert positions into a board.
+
+        Arguments:
+            positions: Coordinates in the maze matrix.
+
+        Returns:
+            The board as an integer.
+        """
+
+        board = 0
+        for row, col in positions:
+            board |= 1 << (row * self.width + col)
+
+        return board
+
+
+    def to_positions(self, board: int) -> list[tuple[int, int]]:
+        """
+        Convert a board into positions.
+
+        Arguments:
+            board: The board as an integer.
+
+        Returns:
+            The coordinates of each space on the board, ordered by row and column.
+        """
+
+        return [divmod(flat, self.width) for flat in np.flatnonzero(self.to_array(board)).tolist()]
+
+
+    def get_first_pos(self, board: int) -> tuple[int, int] | None:
+        """
+        Get the first position on a board, ordered by row and column.
+
+        Arguments:
+            board: The board as an integer.
+
+        Returns:
+            The coordinates of the position or None if the board is empty.
+        """
+
+        if not board:
+            return None
+
+        return divmod((board & -board).bit_length() - 1, self.width)
+
+
+    def expand(self, board: int) -> int:
+        """
+        Expand a board by one step in every direction, without going through walls.
+
+        Arguments:
+            board: The board as an integer.
+
+        Returns:
+            The board with all spaces reachable in at most one step.
+        """
+
+        return (board | board << 1 | board >> 1 | board << self.width | board >> self.width) & self.paths
+
+
+    def iter_layers(self, source: int) -> Iterator[int]:
+        """
+        Iterate over the BFS layers of a board.
+
+        Arguments:
+            source: The board to start from, layer 0.
+
+        Returns:
+            An iterator over the layers, where layer N holds the spaces exactly N steps away from the source.
+        """
+
+        visited = frontier = source & self.paths
+
+        while frontier:
+            yield frontier
+            reached = self.expand(frontier)
+            frontier = reached & ~visited
+            visited |= reached
+
+
+    def get_reachable(self, position: tuple[int, int]) -> int:
+        """
+        Get all spaces reachable from a position.
+
+        Arguments:
+            position: Coordinates in the maze matrix.
+
+        Returns:
+            The board of reachable spaces.
+        """
+
+        reachable = 0
+        for layer in self.iter_layers(self.from_positions([position])):
+            reachable |= layer
+
+        return reachable
+
+
+    def is_reachable(self, position_a: tuple[int, int], position_b: tuple[int, int]) -> bool:
+        """
+        Check whether two positions are connected.
+
+        Arguments:
+            position_a: Coordinates of the first position in the maze matrix.
+            position_b: Coordinates of the second position in the maze matrix.
+
+        Returns:
+            True if a path exists between the positions, otherwise False.
+        """
+
+        return self.get_distance(position_a, position_b) >= 0
+
+
+    def get_distance(self, position_a: tuple[int, int], position_b: tuple[int, int]) -> int:
+        """
+        Get the number of steps between two positions.
+
+        Arguments:
+            position_a: Coordinates of the first position in the maze matrix.
+            position_b: Coordinates of the second position in the maze matrix.
+
+        Returns:
+            The number of steps, or -1 if no path exists between the positions.
+        """
+
+        target = self.from_positions([position_b])
+
+        for distance, layer in enumerate(self.iter_layers(self.from_positions([position_a]))):
+            if layer & target:
+                return distance
+
+        return -1
+
+
+    def get_layers(self, position: tuple[int, int]) -> list[int]:
+        """
+        Get all BFS layers of a position.
+
+        Arguments:
+            position: Coordinates in the maze matrix.
+
+        Returns:
+            A list of boards, where the board at index N holds the spaces exactly N steps away from the position.
+        """
+
+        return list(self.iter_layers(self.from_positions([position])))
+
+
+__all__ = ['Bitboard']
@@ -0,0 +1,96 @@
+from array import array
+from collections import OrderedDict
+
+import numpy as np
+
+from .maze import Maze
+
+
+class DistanceField:
+    """
+    Exact path distances from the end of a maze to every space.
+
+    The distances are computed once per maze with a breadth-first search from the end position, and cached by
+    the maze hash, so looking up how far a position is from the end is a single array access. When the cache is
+    full, the least recently used distance field is evicted.
+    """
+
+    max_cached: int = 8
+    cache: OrderedDict[str, np.ndarray] = OrderedDict()
+
+
+    @staticmethod
+    def _compute(maze: Maze) -> np.ndarray:
+        """ Compute the distance field of a maze. """
+
+        width = maze.size_matrix
+        maze.get_neighbor_mask()
+        flat_mask = maze.neighbor_flat
+        mask_offsets = [tuple(move[0] * width + move[1] for move in moves) for moves in Maze.mask_moves]
+
+        distances = array('i', [-1]) * (width * width)
+        frontier = [maze.end_pos[0] * width + maze.end_pos[1]]
+        distances[frontier[0]] = 0
+        distance = 0
+
+        while frontier:
+            distance += 1
+            next_frontier = []
+
+            for space in frontier:
+                for offset in mask_offsets[flat_mask[space]]:
+                    if distances[space + offset] < 0:
+                        distances[space + offset] = distance
+                        next_frontier.append(space + offset)
+
+            frontier = next_frontier
+
+        return np.frombuffer(distances, dtype = np.int32).reshape(width, width)
+
+
+    @staticmethod
+    def get(maze: Maze) -> np.ndarray:
+        """
+        Get the distance field of a maze, computing it only if it's not cached.
+
+        Arguments:
+            maze: Instance of the Maze class.
+
+        Returns:
+            An int32 NumPy array with the same shape as the maze grid, holding the number of steps from each space
+            to the end position, or -1 for walls and unreachable spaces.
+        """
+
+        maze_hash = maze.get_hash()
+        distances = DistanceField.cache.get(maze_hash)
+
+        if distances is not None:
+            DistanceField.cache.move_to_end(maze_hash)
+
+        else:
+            distances = DistanceField._compute(maze)
+            DistanceField.cache[maze_hash] = distances
+
+            while len(DistanceField.cache) > DistanceField.max_cached:
+                DistanceField.cache.popitem(last = False)
+
+        return distances
+
+
+    @staticmethod
+    def get_distance(maze: Maze, position: tuple[int, int]) -> int:
+        """
+        Get the exact number of steps from a position to the end of a maze.
+
+        Arguments:
+            maze: Instance of the Maze class.
+            position: Coordinates in the maze matrix.
+
+        Returns:
+            The number of steps, or -1 if the position is a wall or can't reach the end.
+        """
+
+        return int(DistanceField.get(maze)[position])
+
+
+__all__ = ['DistanceField']
@@ -0,0 +1,137 @@
+import numpy as np
+
+from .maze import Maze
+
+
+class JunctionGraph:
+    """
+    Compressed graph representation of a maze.
+
+    Long corridors are collapsed into single edges between nodes, where the nodes are junctions, dead ends,
+    and the start and end positions of the maze. Each edge stores the length of the corridor and the path through
+    it, encoded as one byte per move (an index into `Maze.moves`).
+    """
+
+    def __init__(self, maze: Maze) -> None:
+        """
+        Build the junction graph of a maze.
+
+        Arguments:
+            maze: Instance of the Maze class.
+        """
+
+        self.maze = maze
+
+        width = maze.size_matrix
+        mask = maze.get_neighbor_mask()
+        flat_mask = maze.neighbor_flat
+        offsets = [move[0] * width + move[1] for move in Maze.moves]
+
+        degrees = sum((mask >> bit) & 1 for bit in range(4))
+        is_node = (maze.grid == maze.path) & (degrees != 2)
+        is_node[maze.start_pos] = is_node[maze.end_pos] = True
+
+        flat_nodes = np.flatnonzero(is_node).tolist()
+        flat_ids = {flat: node_id for node_id, flat in enumerate(flat_nodes)}
+
+        self.nodes = [divmod(flat, width) for flat in flat_nodes]
+        self.node_ids = {node: node_id for node_id, node in enumerate(self.nodes)}
+        self.edges = [{} for _ in self.nodes]
+
+        walked = set()
+
+        for node_id, flat in enumerate(flat_nodes):
+            for first_move in range(4):
+                if not flat_mask[flat] >> first_move & 1 or (node_id, first_move) in walked:
+                    continue
+
+                moves = [first_move]
+                current = flat + offsets[first_move]
+
+                # Follow the corridor, every space in it has exactly one way forward
+                while current not in flat_ids:
+                    moves.append((flat_mask[current] & ~(1 << (moves[-1] ^ 1))).bit_length() - 1)
+                    current += offsets[moves[-1]]
+
+                other_id = flat_ids[current]
+                self.edges[node_id][other_id] = len(moves), bytes(moves)
+                self.edges[other_id][node_id] = len(moves), bytes(move ^ 1 for move in reversed(moves))
+                walked.add((other_id, moves[-1] ^ 1))
+
+
+    @staticmethod
+    def get(maze: Maze) -> 'JunctionGraph':
+        """
+        Get the junction graph of a maze, building it only on the first call for that maze.
+
+        Arguments:
+            maze: Instance of the Maze class.
+
+        Returns:
+            A JunctionGraph object.
+        """
+
+        if maze.junction_graph is None:
+            maze.junction_graph = JunctionGraph(maze)
+
+        return maze.junction_graph
+
+
+    def get_edges(self, position: tuple[int, int]) -> list[tuple[tuple[int, int], int, bytes]]:
+        """
+        Get the edges of a node.
+
+        Arguments:
+            position: Coordinates of the node in the maze matrix.
+
+        Returns:
+            A list of (neighboring node position, corridor length, encoded path) tuples.
+        """
+
+        return [(self.nodes[other_id], length, path)
+                for other_id, (length, path) in self.edges[self.node_ids[position]].items()]
+
+
+    def get_path(self, position_a: tuple[int, int], position_b: tuple[int, int]) -> bytes | None:
+        """
+        Get the encoded path of the corridor between two nodes.
+
+        Arguments:
+            position_a: Coordinates of the first node in the maze matrix.
+            position_b: Coordinates of the second node in the maze matrix.
+
+        Returns:
+            The encoded path from the first to the second node, or None if they aren't connected by a corridor.
+        """
+
+        node_a, node_b = self.node_ids.get(position_a), self.node_ids.get(position_b)
+        if node_a is None or node_b not in self.edges[node_a]:
+            return None
+
+        return self.edges[node_a][node_b][1]
+
+
+    @staticmethod
+    def expand(position: tuple[int, int], path: bytes) -> list[tuple[int, int]]:
+        """
+        Expand an encoded path into maze positions.
+
+        Arguments:
+            position: Coordinates the path starts from.
+            path: The encoded path.
+
+        Returns:
+            The positions along the path, excluding the starting position.
+        """
+
+        row, col = position
+        positions = []
+
+        for move in path:
+            row, col = row + Maze.moves[move][0], col + Maze.moves[move][1]
+            positions.append((row, col))
+
+        return positions
+
+
+__all__ = ['JunctionGraph']
@@ -1,86 +1,321 @@
 import random
 
+import numpy as np
+
+from .maze_file import MazeFile
+
 
 class Maze:
     """ Representation of a randomly generated maze. """
 
+    grid: np.ndarray = None
+    matrix: np.ndarray = None
     start_pos: tuple[int, int] = None
     end_pos: tuple[int, int] = None
     wall: int = None  # Set to 0 by the MazeGenerator
     path: int = None  # Set to 1 by the MazeGenerator
+    seed: int = None  # Set by the MazeGenerator if the maze was generated with a seed
+    maze_hash: str = None
+
+    neighbor_mask: np.ndarray = None  # Built by get_neighbor_mask()
+    neighbor_flat: memoryview = None
+    cell_offsets: tuple[tuple[int, ...], ...] = None  # Cell ID offsets for each of the 16 possible masks
+    junction_graph: 'JunctionGraph' = None  # Built by JunctionGraph.get()
+    bitboard: 'Bitboard' = None  # Built by Bitboard.get()
+
+    # Moves in order of the neighbor mask bits: up, down, left, right
+    moves: tuple[tuple[int, int], ...] = ((-1, 0), (1, 0), (0, -1), (0, 1))
+    mask_moves: tuple[tuple[tuple[int, int], ...], ...] = tuple(  # Moves for each of the 16 possible masks
+        tuple(move for bit, move in enumerate(((-1, 0), (1, 0), (0, -1), (0, 1))) if mask >> bit & 1)
+        for mask in range(16)
+    )
 
 
-    def __init__(self, maze: list[list[int]], start_pos: str, end_pos: str) -> None:
+    def __init__(self, maze: list[list[int]] | np.ndarray, start_pos: str | tuple[int, int],
+                 end_pos: str | tuple[int, int], rng: random.Random = random) -> None:
         """
         Initialize the maze.
 
         Start & End Positions:
             top_left, top_right, bottom_left, bottom_right, middle, random, random_corner, random_any.
+            Both positions can also be given as exact (row, col) coordinates.
+
+        Grid Storage:
+            The maze is stored in `grid` as a contiguous uint8 NumPy array. If the given matrix already is one,
+            it is used as is without copying. The `matrix` attribute is a read-only view of the same memory that
+            supports the usual `matrix[row][col]` indexing, although `matrix[row, col]` is faster.
 
         Arguments:
             maze: A 2D binary matrix representing a maze (0 = wall, 1 = path).
             start_pos: Starting position in the maze.
             end_pos: Ending position in the maze.
+            rng: Random number generator for random start and end positions.
         """
 
-        self.matrix = maze
-        self.size_matrix = len(maze)
+        self.grid = np.ascontiguousarray(maze, dtype = np.uint8)
+        self.matrix = self.grid.view()
+        self.matrix.flags.writeable = False
+
+        self.size_matrix = len(self.grid)
         self.size = (self.size_matrix - 1) // 2
-        self.set_start_end_pos(start_pos, end_pos)
+        self.set_start_end_pos(start_pos, end_pos, rng)
 
 
-    def set_start_end_pos(self, start_pos : str, end_pos: str) -> None:
+    def set_start_end_pos(self, start_pos : str | tuple[int, int], end_pos: str | tuple[int, int],
+                          rng: random.Random = random) -> None:
         """
         Change the start and end position coordinates.
 
         Start & End Positions:
             top_left, top_right, bottom_left, bottom_right, middle, random, random_corner, random_any.
+            Both positions can also be given as exact (row, col) coordinates.
 
         Arguments:
             start_pos: Starting position in the maze.
             end_pos: Ending position in the maze.
+            rng: Random number generator for random positions.
         """
 
+        self.start_pos, self.end_pos = Maze.get_start_end_pos(self.size, start_pos, end_pos, rng)
+        self.maze_hash = None
+
+
+    @staticmethod
+    def get_start_end_pos(size: int, start_pos : str | tuple[int, int], end_pos: str | tuple[int, int],
+                          rng: random.Random = random) -> tuple[tuple[int, int], tuple[int, int]]:
+        """
+        Get the start and end position coordinates for a maze of the given size.
+
+        Start & End Positions:
+            top_left, top_right, bottom_left, bottom_right, middle, random, random_corner, random_any.
+            Both positions can also be given as exact (row, col) coordinates.
+
+        Arguments:
+            size: Size of the maze.
+            start_pos: Starting position in the maze.
+            end_pos: Ending position in the maze.
+            rng: Random number generator for random positions.
+
+        Returns:
+            The start and end position coordinates.
+        """
+
+        if isinstance(start_pos, tuple) and isinstance(end_pos, tuple):
+            if start_pos == end_pos:
+                raise Exception('Start and end positions cannot be the same.')
+
+            return start_pos, end_pos
+
         if start_pos == end_pos and not start_pos.startswith('random'):
             raise Exception('Start and end positions cannot be the same.')
 
-        size = self.size
         border_l, border_r = 1, size * 2 - 1
 
         crds = {
             'top_left' : (border_l, border_l), 'top_right' : (border_l, border_r),
             'bottom_left' : (border_r, border_l), 'bottom_right' : (border_r, border_r),
-            'middle' : (size, size),
-            'random_any' : [(r, c) for r in range(1, border_r, 2) for c in range(1, border_r, 2)]
+            'middle' : (size, size)
         }
 
         crds['random_corner'] = [crds['top_left'], crds['top_right'], crds['bottom_left'], crds['bottom_right']]
         crds['random'] = crds['random_corner'] + [crds['middle']]
 
+        if 'random_any' in (start_pos, end_pos):  # Only listed when needed, since it holds size ^ 2 coordinates
+            crds['random_any'] = [(r, c) for r in range(1, border_r, 2) for c in range(1, border_r, 2)]
+
         if start_pos.startswith('random') and end_pos.startswith('random'):
-            start_crds = random.choice(crds[start_pos])
+            start_crds = rng.choice(crds[start_pos])
             if start_crds in crds[end_pos]:
                 crds[end_pos].remove(start_crds)
-            end_crds = random.choice(crds[end_pos])
+            end_crds = rng.choice(crds[end_pos])
 
         elif start_pos.startswith('random'):
             end_crds = crds[end_pos]
             if end_crds in crds[start_pos]:
                 crds[start_pos].remove(end_crds)
-            start_crds = random.choice(crds[start_pos])
+            start_crds = rng.choice(crds[start_pos])
 
         elif end_pos.startswith('random'):
             start_crds = crds[start_pos]
             if start_pos in crds[end_pos]:
                 crds[end_pos].remove(start_crds)
-            end_crds = random.choice(crds[end_pos])
+            end_crds = rng.choice(crds[end_pos])
 
         else:
             start_crds = crds[start_pos]
             end_crds = crds[end_pos]
 
-        self.start_pos = start_crds
-        self.end_pos = end_crds
+        return start_crds, end_crds
+
+
+    def __getstate__(self) -> dict[str, ...]:
+        """ Get the maze state for pickling, without the read-only matrix view. """
+
+        state = self.__dict__.copy()
+        del state['matrix']
+        state.pop('neighbor_mask', None)
+        state.pop('neighbor_flat', None)
+        state.pop('cell_offsets', None)
+        state.pop('junction_graph', None)
+        state.pop('bitboard', None)
+        return state
+
+
+    def __setstate__(self, state: dict[str, ...]) -> None:
+        """ Restore the maze state after unpickling, including the read-only matrix view. """
+
+        self.__dict__.update(state)
+        self.matrix = self.grid.view()
+        self.matrix.flags.writeable = False
+
+
+    def get_neighbor_mask(self) -> np.ndarray:
+        """
+        Get the neighbor table of the maze, building it on the first call.
+
+        Each space in the table is a 4-bit mask of which neighboring spaces are paths (see `Maze.moves` for the
+        order of the bits). The table is built once per maze, making every later legal move check a lookup.
+
+        Returns:
+            The neighbor table as a uint8 NumPy array with the same shape as the maze grid.
+        """
+
+        if self.neighbor_mask is not None:
+            return self.neighbor_mask
+
+        paths = (self.grid == self.path).view(np.uint8)
+        mask = np.zeros_like(paths)
+
+        mask[1:, :] |= paths[:-1, :]
+        mask[:-1, :] |= paths[1:, :] << 1
+        mask[:, 1:] |= paths[:, :-1] << 2
+        mask[:, :-1] |= paths[:, 1:] << 3
+
+        self.neighbor_mask = mask
+        self.neighbor_flat = mask.data.cast('B')
+        self.cell_offsets = tuple(tuple(move[0] * self.size_matrix + move[1] for move in moves)
+                                  for moves in Maze.mask_moves)
+
+        return mask
+
+
+    def get_legal_moves(self, position: tuple[int, int]) -> list[tuple[int, int]]:
+        """
+        Get a list of neighboring paths of the given position, using the neighbor table.
+
+        Arguments:
+            position: Coordinates in the maze matrix.
+
+        Returns:
+            A list of neighboring path positions, in order of `Maze.moves` (up, down, left, right).
+        """
+
+        if self.neighbor_flat is None:
+            self.get_neighbor_mask()
+
+        row, col = position
+        return [(row + move[0], col + move[1])
+                for move in Maze.mask_moves[self.neighbor_flat[row * self.size_matrix + col]]]
+
+
+    def get_cell(self, position: tuple[int, int]) -> int:
+        """
+        Get the cell ID of the given position.
+
+        Cell IDs (`row * size_matrix + col`) index the flattened maze matrix and neighbor table, which lets
+        algorithms work with plain integers instead of position tuples.
+
+        Arguments:
+            position: Coordinates in the maze matrix.
+
+        Returns:
+            The cell ID of the position.
+        """
+
+        return position[0] * self.size_matrix + position[1]
+
+
+    def get_position(self, cell: int) -> tuple[int, int]:
+        """
+        Get the position of the given cell ID.
+
+        Arguments:
+            cell: Cell ID in the maze matrix.
+
+        Returns:
+            The coordinates of the cell in the maze matrix.
+        """
+
+        return divmod(cell, self.size_matrix)
+
+
+    def get_legal_cells(self, cell: int) -> list[int]:
+        """
+        Get a list of neighboring paths of the given cell, using the neighbor table.
+
+        Arguments:
+            cell: Cell ID in the maze matrix.
+
+        Returns:
+            A list of cell IDs of neighboring paths, in order of `Maze.moves` (up, down, left, right).
+        """
+
+        if self.neighbor_flat is None:
+            self.get_neighbor_mask()
+
+        return [cell + offset for offset in self.cell_offsets[self.neighbor_flat[cell]]]
+
+
+    def get_hash(self) -> str:
+        """ Get the hash of the maze (computed once), see `MazeFile.get_hash()`. """
+
+        if self.maze_hash is None:
+            self.maze_hash = MazeFile.get_hash(self.size, self.start_pos, self.end_pos, [self.grid])
+
+        return self.maze_hash
+
+
+    def save(self, path: str) -> None:
+        """
+        Save the maze to a binary maze file (see `MazeFile`), with one byte per space.
+
+        Arguments:
+            path: Path of the file.
+        """
+
+        header = MazeFile.pack_header(MazeFile.matrix, self.size, self.start_pos, self.end_pos, self.get_hash(),
+                                      self.seed, wall = self.wall, path = self.path)
+        MazeFile.write(path, header, [], [self.grid])
+
+
+    @staticmethod
+    def load(path: str) -> 'Maze':
+        """
+        Load a maze from a binary maze file saved with `Maze.save()`.
+
+        The maze grid is memory-mapped in read-only mode, instead of being read into memory.
+        Packed maze files can be loaded with `PackedMaze.load()`.
+
+        Arguments:
+            path: Path of the file.
+
+        Returns:
+            A Maze object.
+        """
+
+        header, _, grid = MazeFile.read(path)
+        if header['encoding'] != MazeFile.matrix:
+            raise Exception(f'{path} contains a packed maze, use PackedMaze.load() instead.')
+
+        size_matrix = header['size'] * 2 + 1
+        maze = Maze(grid.reshape(size_matrix, size_matrix), header['start_pos'], header['end_pos'])
+
+        maze.wall = header['wall']
+        maze.path = header['path']
+        maze.seed = header['seed']
+        maze.maze_hash = header['maze_hash']
+
+        return maze
 
 
     def get_maze_data(self) -> dict[str, ...]:
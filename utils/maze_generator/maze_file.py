@@ -0,0 +1,168 @@
+import hashlib
+import struct
+from typing import Iterable
+
+import numpy as np
+
+
+class MazeFile:
+    """
+    Binary maze file format.
+
+    File Layout:
+        - Header | Magic bytes, format version, grid encoding, wall & path values, maze size, start & end positions,
+          seed, maze hash and the number of pillars (see `header_format`).
+        - Pillars | Row and column of each open space with even coordinates, only used by the packed encoding.
+        - Grid | The maze matrix with one byte per space, or the rows of packed rooms (see `PackedMaze`).
+
+    The grid is memory-mapped when reading, so processes opening the same file share its memory instead of each
+    reading or copying it.
+    """
+
+    magic: bytes = b'MAZE'
+    version: int = 1
+    header_format: str = '<4sBBBBQQQQQ?q16sQ'
+    header_size: int = struct.calcsize(header_format)
+
+    matrix: int = 0  # Grid encoding with one byte per space
+    packed: int = 1  # Grid encoding with two bits per room
+
+
+    @staticmethod
+    def get_hasher(size: int, start_pos: tuple[int, int], end_pos: tuple[int, int]) -> 'hashlib.blake2b':
+        """
+        Get a hash object for hashing a maze row by row, see `MazeFile.get_hash()`.
+
+        Arguments:
+            size: Size of the maze.
+            start_pos: Starting position coordinates in the maze matrix.
+            end_pos: Ending position coordinates in the maze matrix.
+
+        Returns:
+            A hash object to update with the maze matrix rows.
+        """
+
+        return hashlib.blake2b(struct.pack('<5Q', size, *start_pos, *end_pos), digest_size = 16)
+
+
+    @staticmethod
+    def get_hash(size: int, start_pos: tuple[int, int], end_pos: tuple[int, int],
+                 rows: Iterable[np.ndarray | bytes]) -> str:
+        """
+        Get the hash of a maze.
+
+        The hash covers the maze size, start and end positions and all bytes of the maze matrix. The same maze always
+        has the same hash regardless of how it's stored.
+
+        Arguments:
+            size: Size of the maze.
+            start_pos: Starting position coordinates in the maze matrix.
+            end_pos: Ending position coordinates in the maze matrix.
+            rows: Rows or bands of the uint8 maze matrix, in order.
+
+        Returns:
+            The hash as a hexadecimal string.
+        """
+
+        hasher = MazeFile.get_hasher(size, start_pos, end_pos)
+        for row in rows:
+            hasher.update(row)
+
+        return hasher.hexdigest()
+
+
+    @staticmethod
+    def pack_header(encoding: int, size: int, start_pos: tuple[int, int], end_pos: tuple[int, int],
+                    maze_hash: str, seed: int | None = None, num_pillars: int = 0, wall: int = 0,
+                    path: int = 1) -> bytes:
+        """
+        Pack the header of a maze file.
+
+        Arguments:
+            encoding: Grid encoding, either `MazeFile.matrix` or `MazeFile.packed`.
+            size: Size of the maze.
+            start_pos: Starting position coordinates in the maze matrix.
+            end_pos: Ending position coordinates in the maze matrix.
+            maze_hash: Hash of the maze, see `MazeFile.get_hash()`.
+            seed: Seed the maze was generated with, if any.
+            num_pillars: Number of open spaces with even coordinates stored after the header.
+            wall: Value used for walls in the maze matrix.
+            path: Value used for paths in the maze matrix.
+
+        Returns:
+            The header bytes.
+        """
+
+        return struct.pack(
+            MazeFile.header_format, MazeFile.magic, MazeFile.version, encoding, wall, path, size,
+            *start_pos, *end_pos, seed is not None, 0 if seed is None else seed, bytes.fromhex(maze_hash), num_pillars
+        )
+
+
+    @staticmethod
+    def write(path: str, header: bytes, pillars: Iterable[tuple[int, int]], grid: Iterable[np.ndarray | bytes]) -> None:
+        """
+        Write a maze file.
+
+        Arguments:
+            path: Path of the file.
+            header: The header bytes, see `MazeFile.pack_header()`.
+            pillars: Open spaces with even coordinates.
+            grid: Rows or bands of the grid in the chosen encoding, in order.
+        """
+
+        with open(path, 'wb') as file:
+            file.write(header)
+            for row, col in pillars:
+                file.write(struct.pack('<2Q', row, col))
+            for row in grid:
+                file.write(row)
+
+
+    @staticmethod
+    def read(path: str) -> tuple[dict[str, ...], set[tuple[int, int]], np.memmap]:
+        """
+        Read a maze file.
+
+        Arguments:
+            path: Path of the file.
+
+        Returns:
+            The header as a dictionary, the pillars, and the grid bytes memory-mapped in read-only mode.
+        """
+
+        with open(path, 'rb') as file:
+            fields = struct.unpack(MazeFile.header_format, file.read(MazeFile.header_size))
+            (magic, version, encoding, wall, path_value, size,
+             *positions, has_seed, seed, maze_hash, num_pillars) = fields
+
+            if magic != MazeFile.magic:
+                raise Exception(f'{path} is not a maze file.')
+            if version != MazeFile.version:
+                raise Exception(f'Unsupported maze file version {version}.')
+
+            pillars = {struct.unpack('<2Q', file.read(16)) for _ in range(num_pillars)}
+
+        header = {
+            'encoding': encoding,
+            'size': size,
+            'start_pos': (positions[0], positions[1]),
+            'end_pos': (positions[2], positions[3]),
+            'seed': seed if has_seed else None,
+            'maze_hash': maze_hash.hex(),
+            'wall': wall,
+            'path': path_value
+        }
+
+        if encoding == MazeFile.matrix:
+            grid_size = (size * 2 + 1) ** 2
+        else:
+            grid_size = size * ((size + 3) // 4)
+
+        grid = np.memmap(path, dtype = np.uint8, mode = 'r', offset = MazeFile.header_size + num_pillars * 16,
+                         shape = (grid_size,))
+
+        return header, pillars, grid
+
+
+__all__ = ['MazeFile']
@@ -1,4 +1,8 @@
+import os
 import random
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
 
 from .maze import Maze
 
@@ -11,23 +15,19 @@ class MazeGenerator:
 
 
     @staticmethod
-    def _gen_empty_maze(size: int) -> list[list[int]]:
+    def _gen_empty_maze(size: int) -> np.ndarray:
         """ Generate an empty maze. """
 
         size = size * 2 + 1
-        maze = []
 
-        for row in range(1, size + 1):
-            if row % 2 == 1:
-                maze.append([MazeGenerator.wall for _ in range(size)])
-            else:
-                maze.append([MazeGenerator.wall if col % 2 == 0 else MazeGenerator.path for col in range(size)])
+        maze = np.full((size, size), MazeGenerator.wall, dtype = np.uint8)
+        maze[1::2, 1::2] = MazeGenerator.path
 
         return maze
 
 
     @staticmethod
-    def _gen_maze_paths(maze: list[list[int]], size: int) -> list[list[int]]:
+    def _gen_maze_paths(maze: np.ndarray, size: int, rng: random.Random = random) -> np.ndarray:
         """ Generate paths in an empty maze. """
 
         u_limit, d_limit, l_limit, r_limit = 1, size * 2 - 1, 3, size * 2 - 1
@@ -43,9 +43,9 @@ class MazeGenerator:
                     d_limit -= 2
                     path_r, path_c = 0, 1
                 else:
-                    path_r, path_c = random.choice(((1, 0), (0, 1)))
+                    path_r, path_c = rng.choice(((1, 0), (0, 1)))
 
-                maze[row + path_r][col + path_c] = MazeGenerator.path
+                maze[row + path_r, col + path_c] = MazeGenerator.path
                 continue
 
             if direction == (0, 2):
@@ -54,9 +54,9 @@ class MazeGenerator:
                     r_limit -= 2
                     path_r, path_c = -1, 0
                 else:
-                    path_r, path_c = random.choice(((0, 1), (-1, 0)))
+                    path_r, path_c = rng.choice(((0, 1), (-1, 0)))
 
-                maze[row + path_r][col + path_c] = MazeGenerator.path
+                maze[row + path_r, col + path_c] = MazeGenerator.path
                 continue
 
             if direction == (-2, 0):
@@ -65,9 +65,9 @@ class MazeGenerator:
                     u_limit += 2
                     path_r, path_c = 0, -1
                 else:
-                    path_r, path_c = random.choice(((0, -1), (-1, 0)))
+                    path_r, path_c = rng.choice(((0, -1), (-1, 0)))
 
-                maze[row + path_r][col + path_c] = MazeGenerator.path
+                maze[row + path_r, col + path_c] = MazeGenerator.path
                 continue
 
             if direction == (0, -2):
@@ -76,49 +76,166 @@ class MazeGenerator:
                     l_limit += 2
                     path_r, path_c = 1, 0
                 else:
-                    path_r, path_c = random.choice(((0, -1), (1, 0)))
+                    path_r, path_c = rng.choice(((0, -1), (1, 0)))
 
-                maze[row + path_r][col + path_c] = MazeGenerator.path
+                maze[row + path_r, col + path_c] = MazeGenerator.path
                 continue
 
-        maze[size][size] = MazeGenerator.path
+        return MazeGenerator._gen_maze_center(maze, size)
+
+
+    @staticmethod
+    def _gen_spiral(size: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Get the spiral order in which paths are generated.
+
+        Returns:
+            The flat matrix indices and direction indices of the empty spaces in spiral order (the last space
+            excluded), and a mask of the spaces where the spiral turns.
+        """
+
+        width = size * 2 + 1
+        leg_lengths = np.array([size] + [size - 1 - i // 2 for i in range(2 * size - 2)], dtype = np.int64)
+
+        directions = np.repeat(np.arange(len(leg_lengths), dtype = np.int8) % 4, leg_lengths)
+        steps = np.array([2 * width, 2, -2 * width, -2], dtype = np.int64)
+        positions = np.cumsum(steps[directions]) + 1 - width
+
+        turns = np.zeros(size ** 2, dtype = bool)
+        turns[np.cumsum(leg_lengths) - 1] = True
+
+        return positions[:-1], directions[:-1], turns[:-1]
+
+
+    @staticmethod
+    def _gen_maze_paths_vectorized(maze: np.ndarray, size: int, rng: np.random.Generator) -> np.ndarray:
+        """
+        Generate paths in an empty maze, all at once.
+
+        Produces the same kind of paths as `_gen_maze_paths()`: each space in the spiral is connected either to the
+        next space in the spiral or to the inner side of the spiral, and always to the inner side where it turns.
+        """
+
+        positions, directions, turns = MazeGenerator._gen_spiral(size)
+        width = size * 2 + 1
+
+        paths = (directions + (rng.integers(0, 2, len(directions), dtype = np.int8) | turns)) % 4
+        offsets = np.array([width, 1, -width, -1], dtype = np.int64)
+        maze.reshape(-1)[positions + offsets[paths]] = MazeGenerator.path
+
+        return MazeGenerator._gen_maze_center(maze, size)
+
+
+    @staticmethod
+    def _gen_maze_center(maze: np.ndarray, size: int) -> np.ndarray:
+        """ Open the center of the maze and prevent loops around it for even sizes. """
+
+        maze[size, size] = MazeGenerator.path
 
         if size % 2 != 0:
             return maze
 
-        if maze[size - 1][size] == MazeGenerator.path:
-            maze[size][size + 1] = MazeGenerator.wall
+        if maze[size - 1, size] == MazeGenerator.path:
+            maze[size, size + 1] = MazeGenerator.wall
         else:
-            maze[size + 1][size] = MazeGenerator.wall
+            maze[size + 1, size] = MazeGenerator.wall
 
         return maze
 
 
     @staticmethod
-    def generate(size: int, start_pos: str, end_pos: str) -> Maze:
+    def generate(size: int, start_pos: str, end_pos: str, vectorized: bool = False, seed: int = None) -> Maze:
         """
         Generate a random maze.
 
         Start & End Positions:
             top_left, top_right, bottom_left, bottom_right, middle, random, random_corner, random_any.
 
+        Generation Modes:
+            - Sequential | Walks the spiral one space at a time.
+            - Vectorized | Computes the spiral and all paths at once with NumPy, much faster for large sizes.
+            Both modes generate the same kind of mazes, but not the same maze for the same seed.
+
         Arguments:
             size: Size of the maze.
             start_pos: Starting position in the maze.
             end_pos: Ending position in the maze.
+            vectorized: Whether to use the vectorized generation mode.
+            seed: Seed for generating the same maze every time, defaults to the global random state.
 
         Returns:
             A Maze object.
         """
 
+        rng = random if seed is None else random.Random(seed)
+
         maze = MazeGenerator._gen_empty_maze(size)
-        maze = MazeGenerator._gen_maze_paths(maze, size)
-        maze = Maze(maze, start_pos, end_pos)
+        if vectorized:
+            maze = MazeGenerator._gen_maze_paths_vectorized(maze, size, np.random.default_rng(rng.getrandbits(64)))
+        else:
+            maze = MazeGenerator._gen_maze_paths(maze, size, rng)
+        maze = Maze(maze, start_pos, end_pos, rng)
 
         maze.wall = MazeGenerator.wall
         maze.path = MazeGenerator.path
+        maze.seed = seed
 
         return maze
 
 
+    @staticmethod
+    def _gen_batch_maze(spec: tuple[int, str, str, int], vectorized: bool, path: str | None) -> Maze | str:
+        """ Generate a single maze of a batch, and save it if a path is given. """
+
+        size, start_pos, end_pos, seed = spec
+        maze = MazeGenerator.generate(size, start_pos, end_pos, vectorized, seed)
+
+        if path is None:
+            return maze
+
+        maze.save(path)
+        return path
+
+
+    @staticmethod
+    def generate_batch(specs: list[tuple[int, str, str, int]], num_workers: int = None, vectorized: bool = False,
+                       directory: str = None) -> list[Maze]:
+        """
+        Generate multiple random mazes in parallel, using a pool of processes.
+
+        Each maze is generated with its own seed, so the same specs always result in the same mazes regardless
+        of the number of workers.
+
+        Arguments:
+            specs: List of (size, start_pos, end_pos, seed) tuples, see `MazeGenerator.generate()`.
+            num_workers: Number of worker processes, defaults to the number of CPUs. Set to 1 to generate in
+                         the current process.
+            vectorized: Whether to use the vectorized generation mode.
+            directory: Directory to save the mazes to. If given, the workers save the mazes as maze files and the
+                       returned mazes are memory-mapped from them (see `Maze.load()`) instead of being copied
+                       between processes.
+
+        Returns:
+            A list of Maze objects, in the same order as the specs.
+        """
+
+        num_workers = num_workers if num_workers else os.cpu_count()
+        paths = [None] * len(specs) if directory is None else \
+            [os.path.join(directory, f'maze_{i}_{size}_{seed}.maze') for i, (size, _, _, seed) in enumerate(specs)]
+        vectorized = [vectorized] * len(specs)
+
+        if num_workers == 1:
+            results = list(map(MazeGenerator._gen_batch_maze, specs, vectorized, paths))
+        else:
+            with ProcessPoolExecutor(max_workers = num_workers) as executor:
+                chunksize = max(1, len(specs) // (num_workers * 4))
+                results = list(executor.map(MazeGenerator._gen_batch_maze, specs, vectorized, paths,
+                                            chunksize = chunksize))
+
+        if directory is None:
+            return results
+
+        return [Maze.load(path) for path in results]
+
+
 __all__ = ['MazeGenerator']
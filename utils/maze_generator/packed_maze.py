@@ -0,0 +1,294 @@
+from typing import Iterator
+
+import numpy as np
+
+from .maze import Maze
+from .maze_file import MazeFile
+
+
+class PackedMaze:
+    """
+    Compact bit-packed representation of a maze.
+
+    Instead of storing every space of the `(size * 2 + 1) ^ 2` matrix, only two bits are stored for each of the
+    `size ^ 2` rooms (spaces with odd coordinates): whether the wall to its right and the wall below it are open.
+    Four rooms are packed into each byte and every row of rooms starts on a new byte.
+    """
+
+    east: int = 1  # Bit set when the wall to the right of a room is open
+    south: int = 2  # Bit set when the wall below a room is open
+
+    seed: int = None
+    maze_hash: str = None
+
+
+    def __init__(self, size: int, cells: bytearray | bytes | np.ndarray, start_pos: tuple[int, int],
+                 end_pos: tuple[int, int], pillars: set[tuple[int, int]] = None, wall: int = 0, path: int = 1) -> None:
+        """
+        Initialize the packed maze.
+
+        Arguments:
+            size: Size of the maze.
+            cells: Packed room bits, `size * ((size + 3) // 4)` bytes in row order.
+            start_pos: Starting position coordinates in the maze matrix.
+            end_pos: Ending position coordinates in the maze matrix.
+            pillars: Open spaces with even coordinates (ex. the center correction made for even sized mazes).
+            wall: Value used for walls in the maze matrix.
+            path: Value used for paths in the maze matrix.
+        """
+
+        self.size = size
+        self.size_matrix = size * 2 + 1
+        self.row_bytes = (size + 3) // 4
+        self.cells = cells
+        self.start_pos = start_pos
+        self.end_pos = end_pos
+        self.pillars = set() if pillars is None else pillars
+        self.wall = wall
+        self.path = path
+
+        if len(cells) != self.size * self.row_bytes:
+            raise Exception(f'Expected {self.size * self.row_bytes} bytes of packed cells, got {len(cells)}.')
+
+
+    @staticmethod
+    def from_matrix(matrix: list[list[int]] | np.ndarray, start_pos: tuple[int, int], end_pos: tuple[int, int],
+                    wall: int = 0, path: int = 1) -> 'PackedMaze':
+        """
+        Pack a maze matrix.
+
+        Arguments:
+            matrix: A 2D binary matrix representing a maze.
+            start_pos: Starting position coordinates in the maze matrix.
+            end_pos: Ending position coordinates in the maze matrix.
+            wall: Value used for walls in the maze matrix.
+            path: Value used for paths in the maze matrix.
+
+        Returns:
+            A PackedMaze object.
+        """
+
+        grid = np.asarray(matrix) == path
+        size = (len(grid) - 1) // 2
+
+        if grid[0].any() or grid[-1].any() or grid[:, 0].any() or grid[:, -1].any():
+            raise Exception('Only mazes surrounded by walls can be packed.')
+        if not grid[1::2, 1::2].all():
+            raise Exception('Only mazes without walls on spaces with odd coordinates can be packed.')
+
+        packed = PackedMaze.pack_rows(grid[1:-1:2, 2::2] * PackedMaze.east | grid[2::2, 1:-1:2] * PackedMaze.south)
+        pillars = {(int(row) * 2, int(col) * 2) for row, col in np.argwhere(grid[::2, ::2])}
+
+        return PackedMaze(size, bytearray(packed.tobytes()), start_pos, end_pos, pillars, wall, path)
+
+
+    @staticmethod
+    def pack_rows(codes: np.ndarray) -> np.ndarray:
+        """
+        Pack rows of room bits, four rooms per byte.
+
+        Arguments:
+            codes: Room bits with one row of rooms on the last axis.
+
+        Returns:
+            The packed bytes with each row padded to a whole number of bytes.
+        """
+
+        size = codes.shape[-1]
+        padded = np.zeros(codes.shape[:-1] + ((size + 3) // 4 * 4,), dtype = np.uint8)
+        padded[..., :size] = codes
+        padded = padded.reshape(codes.shape[:-1] + (-1, 4))
+
+        return padded[..., 0] | padded[..., 1] << 2 | padded[..., 2] << 4 | padded[..., 3] << 6
+
+
+    @staticmethod
+    def from_maze(maze: Maze) -> 'PackedMaze':
+        """
+        Pack a maze.
+
+        Arguments:
+            maze: Instance of the Maze class.
+
+        Returns:
+            A PackedMaze object.
+        """
+
+        packed = PackedMaze.from_matrix(maze.grid, maze.start_pos, maze.end_pos, maze.wall, maze.path)
+        packed.seed = maze.seed
+        packed.maze_hash = maze.maze_hash
+
+        return packed
+
+
+    def to_matrix(self) -> np.ndarray:
+        """ Unpack the maze into a 2D binary matrix. """
+
+        packed = np.frombuffer(self.cells, dtype = np.uint8).reshape(self.size, self.row_bytes)
+        codes = np.stack([packed >> shift & 3 for shift in (0, 2, 4, 6)], axis = -1)
+        codes = codes.reshape(self.size, self.row_bytes * 4)[:, :self.size]
+
+        matrix = np.full((self.size_matrix, self.size_matrix), self.wall, dtype = np.uint8)
+        matrix[1::2, 1::2] = self.path
+        matrix[1:-1:2, 2::2] = np.where(codes & PackedMaze.east, self.path, self.wall)
+        matrix[2::2, 1:-1:2] = np.where(codes & PackedMaze.south, self.path, self.wall)
+
+        for row, col in self.pillars:
+            matrix[row, col] = self.path
+
+        return matrix
+
+
+    def to_maze(self) -> Maze:
+        """ Unpack the maze into a Maze object. """
+
+        maze = Maze(self.to_matrix(), self.start_pos, self.end_pos)
+        maze.wall = self.wall
+        maze.path = self.path
+        maze.seed = self.seed
+        maze.maze_hash = self.maze_hash
+
+        return maze
+
+
+    def iter_matrix_rows(self) -> Iterator[np.ndarray]:
+        """
+        Unpack the maze one band of matrix rows at a time.
+
+        The first band is the top wall, followed by one band of two rows (the rooms and the walls below them)
+        for each row of rooms.
+
+        Returns:
+            An iterator over the maze matrix row bands, as uint8 NumPy arrays.
+        """
+
+        yield np.full((1, self.size_matrix), self.wall, dtype = np.uint8)
+
+        packed = np.frombuffer(self.cells, dtype = np.uint8).reshape(self.size, self.row_bytes)
+        for row in range(self.size):
+            codes = np.stack([packed[row] >> shift & 3 for shift in (0, 2, 4, 6)], axis = -1).reshape(-1)[:self.size]
+
+            band = np.full((2, self.size_matrix), self.wall, dtype = np.uint8)
+            band[0, 1::2] = self.path
+            band[0, 2::2] = np.where(codes & PackedMaze.east, self.path, self.wall)
+            band[1, 1::2] = np.where(codes & PackedMaze.south, self.path, self.wall)
+
+            for pillar_row, pillar_col in self.pillars:
+                if pillar_row == row * 2 + 2:
+                    band[1, pillar_col] = self.path
+
+            yield band
+
+
+    def get_hash(self) -> str:
+        """ Get the hash of the maze (computed once), see `MazeFile.get_hash()`. """
+
+        if self.maze_hash is None:
+            self.maze_hash = MazeFile.get_hash(self.size, self.start_pos, self.end_pos, self.iter_matrix_rows())
+
+        return self.maze_hash
+
+
+    def save(self, path: str) -> None:
+        """
+        Save the packed maze to a binary maze file (see `MazeFile`).
+
+        Arguments:
+            path: Path of the file.
+        """
+
+        header = MazeFile.pack_header(MazeFile.packed, self.size, self.start_pos, self.end_pos, self.get_hash(),
+                                      self.seed, len(self.pillars), self.wall, self.path)
+        MazeFile.write(path, header, sorted(self.pillars), [self.cells])
+
+
+    @staticmethod
+    def load(path: str) -> 'PackedMaze':
+        """
+        Load a packed maze from a binary maze file saved with `PackedMaze.save()` or `StreamGenerator.save()`.
+
+        The packed rooms are memory-mapped in read-only mode, instead of being read into memory.
+
+        Arguments:
+            path: Path of the file.
+
+        Returns:
+            A PackedMaze object.
+        """
+
+        header, pillars, cells = MazeFile.read(path)
+        if header['encoding'] != MazeFile.packed:
+            raise Exception(f'{path} does not contain a packed maze, use Maze.load() instead.')
+
+        packed = PackedMaze(header['size'], cells, header['start_pos'], header['end_pos'], pillars,
+                            header['wall'], header['path'])
+        packed.seed = header['seed']
+        packed.maze_hash = header['maze_hash']
+
+        return packed
+
+
+    def get_cell(self, row: int, col: int) -> int:
+        """
+        Get the packed bits of a room.
+
+        Arguments:
+            row: Row of the room (not the row in the maze matrix).
+            col: Column of the room (not the column in the maze matrix).
+
+        Returns:
+            The room bits, see `PackedMaze.east` and `PackedMaze.south`.
+        """
+
+        return self.cells[row * self.row_bytes + (col >> 2)] >> ((col & 3) << 1) & 3
+
+
+    def is_path(self, position: tuple[int, int]) -> bool:
+        """
+        Check whether a position in the maze matrix is a path.
+
+        Arguments:
+            position: Coordinates in the maze matrix.
+
+        Returns:
+            True if the position is a path, otherwise False.
+        """
+
+        row, col = position
+
+        if not (0 < row < self.size_matrix - 1 and 0 < col < self.size_matrix - 1):
+            return False
+
+        if row & 1 and col & 1:
+            return True
+        if row & 1:
+            return bool(self.get_cell(row >> 1, (col >> 1) - 1) & PackedMaze.east)
+        if col & 1:
+            return bool(self.get_cell((row >> 1) - 1, col >> 1) & PackedMaze.south)
+
+        return position in self.pillars
+
+
+    def get_legal_moves(self, position: tuple[int, int]) -> list[tuple[int, int]]:
+        """
+        Get a list of legal moves from the given position.
+
+        Arguments:
+            position: Coordinates in the maze matrix.
+
+        Returns:
+            A list of new positions that can be visited from the given position, in the same order as the
+            algorithms' `get_legal_moves()` function (up, down, left, right).
+        """
+
+        check_moves = [
+            (position[0] - 1, position[1]),
+            (position[0] + 1, position[1]),
+            (position[0], position[1] - 1),
+            (position[0], position[1] + 1)
+        ]
+
+        return [move for move in check_moves if self.is_path(move)]
+
+
+__all__ = ['PackedMaze']
@@ -0,0 +1,208 @@
+import random
+from typing import BinaryIO, Iterator
+
+import numpy as np
+
+from .maze import Maze
+from .maze_file import MazeFile
+from .packed_maze import PackedMaze
+
+
+class StreamGenerator:
+    """
+    Random maze generator using Eller's algorithm, emitting the maze one row at a time.
+
+    Only the current row of rooms is kept in memory, so the memory usage is O(size) regardless of the number of rows.
+    Unlike the MazeGenerator, the paths don't follow a spiral pattern, but every maze still has exactly one unique
+    path between any two empty spaces.
+    """
+
+    wall: int = 0
+    path: int = 1
+
+
+    @staticmethod
+    def _gen_room_rows(size: int, rng: random.Random) -> Iterator[tuple[list[bool], list[bool]]]:
+        """ Generate the rows of rooms, along with which walls to their right and below them are open. """
+
+        sets = list(range(size))
+        members = {set_id: [col] for col, set_id in enumerate(sets)}
+        next_set_id = size
+
+        for row in range(size):
+            last_row = row == size - 1
+            east = [False] * size
+            south = [False] * size
+
+            # Join adjacent rooms from different sets, always on the last row
+            for col in range(size - 1):
+                set_a, set_b = sets[col], sets[col + 1]
+                if set_a == set_b or not (last_row or rng.random() < 0.5):
+                    continue
+
+                if len(members[set_a]) < len(members[set_b]):
+                    set_a, set_b = set_b, set_a
+
+                for member in members[set_b]:
+                    sets[member] = set_a
+                members[set_a].extend(members.pop(set_b))
+                east[col] = True
+
+            if last_row:
+                yield east, south
+                break
+
+            # Open at least one wall downwards for each set
+            for cols in members.values():
+                downs = [col for col in cols if rng.random() < 0.5] or [rng.choice(cols)]
+                for col in downs:
+                    south[col] = True
+
+            yield east, south
+
+            members = {}
+            for col in range(size):
+                if not south[col]:
+                    sets[col] = next_set_id
+                    next_set_id += 1
+                members.setdefault(sets[col], []).append(col)
+
+
+    @staticmethod
+    def _pack_row(east: list[bool], south: list[bool]) -> bytes:
+        """ Pack a row of rooms. """
+
+        codes = (np.array(east, dtype = np.uint8) * PackedMaze.east |
+                 np.array(south, dtype = np.uint8) * PackedMaze.south)
+        return PackedMaze.pack_rows(codes).tobytes()
+
+
+    @staticmethod
+    def _gen_band(east: list[bool], south: list[bool]) -> np.ndarray:
+        """ Generate the band of matrix rows for a row of rooms. """
+
+        wall, path = StreamGenerator.wall, StreamGenerator.path
+
+        band = np.full((2, len(east) * 2 + 1), wall, dtype = np.uint8)
+        band[0, 1::2] = path
+        band[0, 2::2] = np.where(east, path, wall)
+        band[1, 1::2] = np.where(south, path, wall)
+
+        return band
+
+
+    @staticmethod
+    def iter_packed_rows(size: int, seed: int = None) -> Iterator[bytes]:
+        """
+        Generate a random maze as rows of packed rooms.
+
+        The rows use the same layout as `PackedMaze.cells`, so joining all of them gives a valid PackedMaze.
+
+        Arguments:
+            size: Size of the maze.
+            seed: Seed for generating the same maze every time, defaults to the global random state.
+
+        Returns:
+            An iterator over the packed bytes of each row of rooms.
+        """
+
+        rng = random if seed is None else random.Random(seed)
+
+        for east, south in StreamGenerator._gen_room_rows(size, rng):
+            yield StreamGenerator._pack_row(east, south)
+
+
+    @staticmethod
+    def iter_matrix_rows(size: int, seed: int = None) -> Iterator[np.ndarray]:
+        """
+        Generate a random maze as bands of maze matrix rows.
+
+        The first band is the top wall, followed by one band of two rows (the rooms and the walls below them)
+        for each row of rooms.
+
+        Arguments:
+            size: Size of the maze.
+            seed: Seed for generating the same maze every time, defaults to the global random state.
+
+        Returns:
+            An iterator over the maze matrix row bands, as uint8 NumPy arrays.
+        """
+
+        rng = random if seed is None else random.Random(seed)
+
+        yield np.full((1, size * 2 + 1), StreamGenerator.wall, dtype = np.uint8)
+
+        for east, south in StreamGenerator._gen_room_rows(size, rng):
+            yield StreamGenerator._gen_band(east, south)
+
+
+    @staticmethod
+    def generate(size: int, output: str | BinaryIO, seed: int = None, packed: bool = True) -> None:
+        """
+        Generate a random maze and write it row by row.
+
+        Output Formats:
+            - packed | Rows of packed rooms, see `iter_packed_rows()`.
+            - matrix | Rows of the maze matrix with one byte per space, see `iter_matrix_rows()`.
+
+        Arguments:
+            size: Size of the maze.
+            output: Path of the output file or a binary writer.
+            seed: Seed for generating the same maze every time, defaults to the global random state.
+            packed: Whether to write the packed format instead of the matrix format.
+        """
+
+        rows = StreamGenerator.iter_packed_rows(size, seed) if packed else \
+            (band.tobytes() for band in StreamGenerator.iter_matrix_rows(size, seed))
+
+        if not isinstance(output, str):
+            for row in rows:
+                output.write(row)
+            return
+
+        with open(output, 'wb') as file:
+            for row in rows:
+                file.write(row)
+
+
+    @staticmethod
+    def save(size: int, path: str, start_pos: str | tuple[int, int], end_pos: str | tuple[int, int],
+             seed: int = None) -> None:
+        """
+        Generate a random maze and save it row by row as a packed binary maze file (see `MazeFile`).
+
+        The saved maze can be loaded with `PackedMaze.load()`.
+
+        Start & End Positions:
+            top_left, top_right, bottom_left, bottom_right, middle, random, random_corner, random_any.
+
+        Arguments:
+            size: Size of the maze.
+            path: Path of the file.
+            start_pos: Starting position in the maze.
+            end_pos: Ending position in the maze.
+            seed: Seed for generating the same maze every time, defaults to the global random state.
+        """
+
+        rng = random if seed is None else random.Random(seed)
+        start_pos, end_pos = Maze.get_start_end_pos(size, start_pos, end_pos, rng)
+        wall, path_value = StreamGenerator.wall, StreamGenerator.path
+
+        hasher = MazeFile.get_hasher(size, start_pos, end_pos)
+        hasher.update(np.full(size * 2 + 1, wall, dtype = np.uint8))
+
+        with open(path, 'wb') as file:
+            # The hash is only known after all rows are generated, so the header is written again at the end
+            file.write(MazeFile.pack_header(MazeFile.packed, size, start_pos, end_pos, '0' * 32, seed,
+                                            wall = wall, path = path_value))
+
+            for east, south in StreamGenerator._gen_room_rows(size, rng):
+                file.write(StreamGenerator._pack_row(east, south))
+                hasher.update(StreamGenerator._gen_band(east, south))
+
+            file.seek(0)
+            file.write(MazeFile.pack_header(MazeFile.packed, size, start_pos, end_pos, hasher.hexdigest(), seed,
+                                            wall = wall, path = path_value))
+
+
+__all__ = ['StreamGenerator']
@@ -1,2 +1,3 @@
 from .maze_solver import *
 from .results_collector import *
+from .results_cache import *
@@ -1,9 +1,11 @@
+import random
 import time
 
-from utils.algorithms import BaseAlgorithmThreaded
-from utils.maze_generator import Maze
+from utils.algorithms import BaseAlgorithmSequential, BaseAlgorithmThreaded
+from utils.maze_generator import Maze, DistanceField
 from utils.assets import Display
 from .results_collector import ResultsCollector
+from .results_cache import ResultsCache
 
 
 class MazeSolver:
@@ -11,7 +13,9 @@ class MazeSolver:
 
     def __init__(self, algorithm_args: dict[str, ...], mazes: list[dict[str, ...]],
                  measure_performance: bool = True, wait_after_step: int | str | None = None,
-                 show_progress: str | bool = True, coloring: bool = False) -> None:
+                 show_progress: str | bool = True, coloring: bool = False,
+                 results_cache: ResultsCache | bool = False, remeasure: bool = False,
+                 progress_interval: int | str = 'auto', threaded_free_running: bool = False) -> None:
         """
         Initialize the maze solver.
 
@@ -27,6 +31,17 @@ class MazeSolver:
             - True | Same as 'text'.
             - False | No real time progression display.
 
+        Progress Intervals:
+            - <int> | Number of steps taken between each progress update (and wait).
+            - 'auto' | Every step if progress is shown or there's waiting after steps, otherwise every 1000 steps.
+
+        Results Caching:
+            When enabled, results of deterministic algorithms (or sequential algorithms given a `'seed'` in
+            algorithm_args) are cached by the maze hash, algorithm, arguments, seed and max steps. Repeated runs
+            return the cached results without solving the maze again or showing and saving any output, unless
+            remeasure is set to True. A `'seed'` seeds the algorithm's own random number generator (`rng`), leaving
+            the `random` module untouched.
+
         Arguments:
              algorithm_args: Dictionary containing algorithm settings.
              mazes: List of dictionaries containing settings for different mazes.
@@ -34,6 +49,10 @@ class MazeSolver:
              wait_after_step: The method for waiting after each step.
              show_progress: The type of real time progress to display when running the algorithm.
              coloring: Whether to use coloring in the progress display.
+             results_cache: Cache for reusing results, True for a new in-memory cache, or False for no caching.
+             remeasure: Whether to solve the maze again and update the cached results instead of reusing them.
+             progress_interval: How often to update the progress and performance measurements.
+             threaded_free_running: Whether threads of threaded algorithms take steps without waiting for each other.
         """
 
         self.algorithm_args = algorithm_args
@@ -41,11 +60,13 @@ class MazeSolver:
         self.measure_performance = measure_performance
         self.show_progress = show_progress
         self.coloring = coloring
+        self.remeasure = remeasure
+        self.threaded_free_running = threaded_free_running
 
-        if wait_after_step == 'input' or wait_after_step is not None:
-            self.threaded_wait_for_flag = True
+        if results_cache is True:
+            self.results_cache = ResultsCache()
         else:
-            self.threaded_wait_for_flag = False
+            self.results_cache = results_cache or None
 
         def wait_method():
             if wait_after_step == 'input':
@@ -54,6 +75,11 @@ class MazeSolver:
                 time.sleep(wait_after_step / 1000)
         self.wait_after_step = wait_method
 
+        if progress_interval == 'auto':
+            self.progress_interval = 1 if show_progress or wait_after_step is not None else 1000
+        else:
+            self.progress_interval = int(progress_interval)
+
 
     @staticmethod
     def _get_max_steps(maze: Maze, max_steps: str | int) -> int:
@@ -63,9 +89,11 @@ class MazeSolver:
             case 'auto':
                 return maze.size ** 2 * 2
             case 'fewest':
-                return int(
-                    12.3 * (abs(maze.start_pos[0] - maze.end_pos[0]) + abs(maze.start_pos[1] - maze.end_pos[1]))
-                )
+                fewest_steps = DistanceField.get_distance(maze, maze.start_pos)
+                if fewest_steps == -1:
+                    raise Exception('The end of the maze is unreachable, so there is no fewest number of steps.')
+
+                return fewest_steps
             case 'unlimited':
                 return 0
             case _:
@@ -77,36 +105,75 @@ class MazeSolver:
 
         maze = maze_args['maze']
         algorithm = self.algorithm_args['algorithm']()
+        max_steps = self._get_max_steps(maze, maze_args['max_steps'])
+
+        cache_key = None
+        seed = self.algorithm_args.get('seed')
+        if self.results_cache is not None and \
+                (algorithm.deterministic or (seed is not None and isinstance(algorithm, BaseAlgorithmSequential))):
+            cache_key = ResultsCache.get_key(maze, self.algorithm_args, max_steps)
+
+            # Cached timings are from an earlier run, so they aren't shown or saved as new results
+            results = None if self.remeasure else self.results_cache.get(cache_key)
+            if results is not None:
+                return results if self.measure_performance else None
 
         display = Display(algorithm, maze,
                           text_display = True if self.show_progress else False,
                           maze_display = True if self.show_progress in ['visual', 'detailed'] else False)
         detailed_progress = self.show_progress == 'detailed'
 
-        max_steps = self._get_max_steps(maze, maze_args['max_steps'])
-        collector = ResultsCollector(algorithm, maze, max_steps)
-        collector.start('measure')
+        try:
+            collector = ResultsCollector(algorithm, maze, max_steps)
+            collector.start('measure')
+
+            if seed is not None:
+                algorithm.rng = random.Random(seed)
 
-        if isinstance(algorithm, BaseAlgorithmThreaded):
-            algorithm.setup(maze = maze, wait_for_flag = self.threaded_wait_for_flag, **self.algorithm_args['args'])
-        else:
             algorithm.setup(maze = maze, **self.algorithm_args['args'])
 
-        collector.start('track')
-        while True:
-            if max_steps != 0 and collector.results['steps_taken'] == max_steps:
-                break
+            collector.start('track')
+
+            if self.threaded_free_running and isinstance(algorithm, BaseAlgorithmThreaded):
+                def on_progress(steps_taken: int) -> None:
+                    collector.update(steps_taken - collector.results['steps_taken'])
+                    progress = collector.get_progress(coloring = self.coloring, details = detailed_progress)
+                    display.update(text = progress, maze_colors = self.coloring)
+
+                algorithm.run_free(max_steps, on_progress = on_progress)
+
+            else:
+                while True:
+                    num_steps = self.progress_interval
+                    if max_steps != 0:
+                        num_steps = min(num_steps, max_steps - collector.results['steps_taken'])
+                        if num_steps <= 0:
+                            break
+
+                    taken_steps, new_pos, reached_end = algorithm.step_many(num_steps)
+                    collector.update(taken_steps)
+
+                    progress = collector.get_progress(coloring = self.coloring, details = detailed_progress)
+                    display.update(text = progress, maze_colors = self.coloring)
+
+                    if new_pos is None or reached_end:
+                        break
+
+                    self.wait_after_step()
+
+            if cache_key is not None:
+                self.results_cache.put(cache_key, collector.get_results('dict'))
 
-            new_pos, reached_end = algorithm.step()
-            collector.update()
+            return self._output_results(algorithm, maze, collector, display)
 
-            progress = collector.get_progress(coloring = self.coloring, details = detailed_progress)
-            display.update(text = progress, maze_colors = self.coloring)
+        # Threads, worker processes and event loops are released even if solving or the output fails
+        finally:
+            algorithm.cleanup()
 
-            if new_pos is None or reached_end:
-                break
 
-            self.wait_after_step()
+    def _output_results(self, algorithm: BaseAlgorithmSequential | BaseAlgorithmThreaded, maze: Maze,
+                        collector: ResultsCollector, display: Display) -> dict[str, ...] | None:
+        """ Display, save and return the results of solving a maze. """
 
         if self.measure_performance:
             results = collector.get_results('string', coloring = self.coloring)
@@ -0,0 +1,126 @@
+import copy
+import hashlib
+import os
+import pickle
+from collections import OrderedDict
+
+from utils.maze_generator import Maze
+
+
+class ResultsCache:
+    """
+    Size-bounded cache of algorithm results, optionally backed by files on disk.
+
+    Each entry holds the results of solving a maze. When the cache is full, the least recently used entry is evicted
+    from memory, but entries saved to disk are kept there and loaded again when needed.
+    """
+
+    def __init__(self, max_size: int = 128, directory: str = None) -> None:
+        """
+        Initialize the results cache.
+
+        Arguments:
+            max_size: The maximum number of entries kept in memory.
+            directory: Directory for storing entries on disk, defaults to memory only.
+        """
+
+        self.max_size = max_size
+        self.directory = directory
+        self.entries: OrderedDict[str, dict[str, ...]] = OrderedDict()
+
+        if directory is not None:
+            os.makedirs(directory, exist_ok = True)
+
+
+    @staticmethod
+    def get_key(maze: Maze, algorithm_args: dict[str, ...], max_steps: int) -> str:
+        """
+        Get the cache key of an algorithm run.
+
+        Arguments:
+            maze: Instance of the maze being solved.
+            algorithm_args: Dictionary containing algorithm settings.
+            max_steps: The maximum number of allowed steps.
+
+        Returns:
+            The key as a hexadecimal string.
+        """
+
+        algorithm = algorithm_args['algorithm']
+        key = (
+            maze.get_hash(), f'{algorithm.__module__}.{algorithm.__qualname__}',
+            sorted(algorithm_args['args'].items()), algorithm_args.get('seed'), max_steps
+        )
+
+        return hashlib.blake2b(repr(key).encode(), digest_size = 16).hexdigest()
+
+
+    def _get_path(self, key: str) -> str:
+        """ Get the path of the file storing an entry. """
+
+        return os.path.join(self.directory, f'{key}.pkl')
+
+
+    def get(self, key: str) -> dict[str, ...] | None:
+        """
+        Get an entry from the cache.
+
+        Arguments:
+            key: The cache key, see `ResultsCache.get_key()`.
+
+        Returns:
+            A copy of the cached results, or None if they're not cached.
+        """
+
+        entry = self.entries.get(key)
+
+        if entry is not None:
+            self.entries.move_to_end(key)
+
+        elif self.directory is not None and os.path.exists(self._get_path(key)):
+            with open(self._get_path(key), 'rb') as file:
+                entry = pickle.load(file)
+            self._add(key, entry)
+
+        return copy.deepcopy(entry)
+
+
+    def put(self, key: str, results: dict[str, ...]) -> None:
+        """
+        Add an entry to the cache, replacing any previous entry with the same key.
+
+        Arguments:
+            key: The cache key, see `ResultsCache.get_key()`.
+            results: The results of the run, see `ResultsCollector.get_results()`.
+        """
+
+        entry = copy.deepcopy(results)
+        self._add(key, entry)
+
+        if self.directory is not None:
+            with open(self._get_path(key), 'wb') as file:
+                pickle.dump(entry, file)
+
+
+    def _add(self, key: str, entry: dict[str, ...]) -> None:
+        """ Add an entry to memory, evicting the least recently used ones if needed. """
+
+        self.entries[key] = entry
+        self.entries.move_to_end(key)
+
+        while len(self.entries) > self.max_size:
+            self.entries.popitem(last = False)
+
+
+    def clear(self) -> None:
+        """ Remove all entries from memory and disk. """
+
+        self.entries.clear()
+
+        if self.directory is not None:
+            for file_name in os.listdir(self.directory):
+                if file_name.endswith('.pkl'):
+                    os.remove(os.path.join(self.directory, file_name))
+
+
+__all__ = ['ResultsCache']
@@ -2,7 +2,7 @@ import time
 import tracemalloc
 
 from utils.algorithms import BaseAlgorithmSequential, BaseAlgorithmThreaded
-from utils.maze_generator import Maze
+from utils.maze_generator import Maze, DistanceField
 from utils.assets import Coloring, ListMaker
 
 
@@ -12,6 +12,8 @@ class ResultsCollector:
     total_time: float = None
     solve_time: float = None
     last_solve_time: float = None
+    step_times_total: float = 0
+    mem_usages_total: float = 0
 
 
     def __init__(self, algorithm: BaseAlgorithmSequential | BaseAlgorithmThreaded, maze: Maze, max_steps: int) -> None:
@@ -26,6 +28,7 @@ class ResultsCollector:
 
         self.algorithm = algorithm
         self.maze = maze
+        self.distances = DistanceField.get(maze)
         self.max_steps = max_steps
         self.results = {
             'steps_taken' : None,
@@ -71,12 +74,17 @@ class ResultsCollector:
             self.results['steps_taken'] = 0
 
 
-    def update(self) -> None:
-        """ Update the algorithm's statistics after taking a step. """
+    def update(self, num_steps: int = 1) -> None:
+        """
+        Update the algorithm's statistics after taking one or more steps.
+
+        Arguments:
+            num_steps: The number of steps taken since the last update.
+        """
 
         step_time = time.time()
 
-        self.results['steps_taken'] += 1
+        self.results['steps_taken'] += num_steps
 
         self.results['solve_time'] = round(step_time - self.solve_time, 2)
         self.results['total_time'] = round(step_time - self.total_time, 2)
@@ -89,22 +97,18 @@ class ResultsCollector:
             current_pos = self.algorithm.get_current_pos(best_pos = True)
 
         self.results['exploration'] = len(self.algorithm.get_visited_pos())
-        self.results['sp_from_end'] = int(
-            abs(current_pos[0] - self.maze.end_pos[0]) +
-            abs(current_pos[1] - self.maze.end_pos[1])
-        )
+        self.results['sp_from_end'] = int(self.distances[current_pos])
 
-        self.results['past_step_times'].append(step_time - self.last_solve_time)
-        self.results['avg_step_time'] = round(
-            sum(self.results['past_step_times']) / len(self.results['past_step_times']), 2
-        )
+        # Running totals keep each update O(1) instead of summing all past values
+        self.results['past_step_times'].append((step_time - self.last_solve_time) / max(num_steps, 1))
+        self.step_times_total += step_time - self.last_solve_time
+        self.results['avg_step_time'] = round(self.step_times_total / max(self.results['steps_taken'], 1), 2)
         self.last_solve_time = step_time
 
         current_mem, peak_mem = tracemalloc.get_traced_memory()
         self.results['past_mem_usages'].append(current_mem / 1024 / 1024)
-        self.results['avg_mem_usage'] = round(
-            sum(self.results['past_mem_usages']) / len(self.results['past_mem_usages']), 2
-        )
+        self.mem_usages_total += current_mem / 1024 / 1024
+        self.results['avg_mem_usage'] = round(self.mem_usages_total / len(self.results['past_mem_usages']), 2)
         self.results['top_mem_usage'] = max(self.results['top_mem_usage'], round(peak_mem / 1024 / 1024, 2))
 
 
@@ -145,7 +149,7 @@ class ResultsCollector:
                 (f'[lb]{self.results["avg_step_time"]} sec[rs]', 'left'),
                 (f'[ly]{self.results["steps_taken"]}[rs] / [ly]{self.max_steps}[rs]', 'left'),
                 (f'[ly]{self.results["exploration"]} spaces[rs]', 'left'),
-                (f'[ly]~{self.results["sp_from_end"]} spaces[rs] from end', 'left'),
+                (f'[ly]{self.results["sp_from_end"]} spaces[rs] from end', 'left'),
                 (f'[lc]{self.results["avg_mem_usage"]} MB[rs]', 'left'),
                 (f'[lc]{self.results["top_mem_usage"]} MB[rs]', 'left')
             ]
@@ -229,7 +233,7 @@ class ResultsCollector:
                 (f'[lb]{self.results["avg_step_time"]} sec[rs]', 'left'),
                 (f'[ly]{self.results["steps_taken"]}[rs] / [ly]{self.max_steps}[rs]', 'left'),
                 (f'[ly]{self.results["exploration"]} spaces[rs]', 'left'),
-                (f'[ly]~{self.results["sp_from_end"]} spaces[rs] from end', 'left'),
+                (f'[ly]{self.results["sp_from_end"]} spaces[rs] from end', 'left'),
                 (reached_end, 'left'),
                 (f'[lc]{self.results["avg_mem_usage"]} MB[rs]', 'left'),
                 (f'[lc]{self.results["top_mem_usage"]} MB[rs]', 'left')